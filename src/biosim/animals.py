@@ -4,6 +4,8 @@ import math
 from copy import deepcopy
 from random import gauss, uniform
 
+import numpy as np
+
 
 class Animal:
     """Animal with corresponding characteristics and traits for different species.
@@ -21,7 +23,10 @@ class Animal:
     weight: `float`
         The animal's weight.
     """
+    __slots__ = ('_age', '_weight', '_F_tilde', '_fitness', '_fitness_version')
+
     params = None
+    _params_version = 0
 
     @classmethod
     def set_params(cls, new_params):
@@ -55,6 +60,8 @@ class Animal:
 
             cls.params[key] = new_params[key]
 
+        cls._params_version += 1
+
     def __init__(self, weight, age=0):
 
         if not isinstance(weight, (int, float)) or weight < 0:
@@ -69,7 +76,8 @@ class Animal:
         self._age = age
 
         self._F_tilde = 0
-        self._fitness = self._calculate_fitness()
+        self._fitness = None
+        self._fitness_version = None
 
     @property
     def age(self):
@@ -81,7 +89,7 @@ class Animal:
     @age.setter
     def age(self, value):
         self._age = value
-        self._fitness = self._calculate_fitness()
+        self._fitness = None
 
     @property
     def weight(self):
@@ -91,7 +99,7 @@ class Animal:
     @weight.setter
     def weight(self, value):
         self._weight = value
-        self._fitness = self._calculate_fitness()
+        self._fitness = None
 
     @property
     def F_tilde(self):
@@ -106,10 +114,16 @@ class Animal:
     def fitness(self):
         """The animal's fitness (`float`, read-only)
 
+        Fitness is calculated on first read after the animal's age, weight or
+        the species' parameters have changed, and cached until the next change.
+
         See Also
         --------
         :py:meth:`._calculate_fitness`
         """
+        if self._fitness is None or self._fitness_version != self._params_version:
+            self._fitness = self._calculate_fitness()
+            self._fitness_version = self._params_version
         return self._fitness
 
     def _calculate_fitness(self):
@@ -152,6 +166,66 @@ class Animal:
             fitness = q_plus * q_minus
             return fitness
 
+    @classmethod
+    def batch_fitness(cls, age, weight):
+        """Calculate the fitness of many animals of the species in one call.
+
+        Notes
+        ------
+        Uses the same formula as :py:meth:`._calculate_fitness`, evaluated with NumPy
+        over whole arrays of ages and weights, e.g. all animals of a species in one cell
+        or on the entire island.
+
+        Parameters
+        ----------
+        age: array_like
+            Ages of the animals.
+        weight: array_like
+            Weights of the animals, same shape as age.
+
+        Returns
+        -------
+        fitness: `ndarray`
+            Fitness of every animal.
+        """
+        age = np.asarray(age, dtype=float)
+        weight = np.asarray(weight, dtype=float)
+
+        with np.errstate(over='ignore'):
+            q_plus = 1 / (1 + np.exp(cls.params['phi_age'] * (age - cls.params['a_half'])))
+            q_minus = 1 / (1 + np.exp(-cls.params['phi_weight'] *
+                                      (weight - cls.params['w_half'])))
+
+        return np.where(weight > 0, q_plus * q_minus, 0.0)
+
+    @classmethod
+    def batch_intake(cls, food_available, num_animals):
+        """Calculate the food eaten by animals eating one after another from a shared supply.
+
+        Notes
+        ------
+        Vectorized version of calling :py:meth:`.eat` repeatedly on hungry animals:
+        animal *i* eats :math:`\\min(F, \\max(0, f - iF))`, where :math:`f` is the food
+        available, i.e. the supply left over by the cumulative appetite of the animals
+        before it.
+
+        Parameters
+        ----------
+        food_available: `int` or `float`
+            Fodder shared by the animals.
+        num_animals: `int`
+            Number of animals, in eating order.
+
+        Returns
+        -------
+        intake: `ndarray`
+            Food eaten by every animal.
+        """
+        appetite = cls.params['F']
+        demand_before = np.arange(num_animals) * appetite
+
+        return np.clip(food_available - demand_before, 0, appetite)
+
     def eat(self, food_available):
         """Animal gains weight from eating.
 
@@ -188,12 +262,56 @@ class Animal:
         self.age += 1
         self.weight -= self.weight * self.params['eta']
 
-    def probability_to_migrate(self):
-        r = uniform(0, 1)
+    def probability_to_migrate(self, r=None):
+        """Decide whether the animal migrates.
+
+        The animal migrates with probability :math:`\\mu\\Phi`.
+
+        Parameters
+        ----------
+        r: `float`, optional
+            Uniform random number in [0, 1). Drawn by the animal if not given.
+
+        Returns
+        -------
+        `bool`
+            True if the animal migrates, otherwise False.
+        """
+        if r is None:
+            r = uniform(0, 1)
         p = self.fitness * self.params['mu']
         return p > r
 
-    def probability_to_give_birth(self, number_of_animals):
+    def can_give_birth(self, number_of_animals, r=None):
+        """Decide whether fertilization takes place and the animal has reached puberty.
+
+        See :py:meth:`.probability_to_give_birth` for the rules. No birth weight is drawn.
+
+        Parameters
+        ----------
+        number_of_animals: `int`
+            Number of same species in current terrain before breeding season.
+        r: `float`, optional
+            Uniform random number in [0, 1) deciding fertilization.
+            Drawn by the animal if not given.
+
+        Returns
+        -------
+        `bool`
+            True if the animal may give birth, otherwise False.
+        """
+        match_probability = min(1, self.params['gamma'] * self.fitness * (number_of_animals - 1))
+        if r is None:
+            r = uniform(0, 1)
+
+        fertilization = r < match_probability
+
+        puberty_weight = self.params['zeta'] * (self.params['w_birth'] + self.params['sigma_birth'])
+        reached_puberty = self.weight > puberty_weight
+
+        return fertilization and reached_puberty
+
+    def probability_to_give_birth(self, number_of_animals, r=None, birth_weight=None):
         """Decide the animal's probability to give birth.
 
         Notes
@@ -221,7 +339,8 @@ class Animal:
         At birth, the mother loses :math:`\\xi` times the birthweight of the baby.
         If this is more than her own weight, no baby is born and mother's weight remain unchanged.
 
-        The baby's birthweight is drawn from a gaussian distribution.
+        The baby's birthweight is drawn from a gaussian distribution,
+        only if fertilization has taken place and puberty is reached.
         If the weight drawn is less than zero, it is treated as miscarriage,
         with no baby born and mother's weight unchanged.
 
@@ -234,30 +353,31 @@ class Animal:
         ----------
         number_of_animals: `int`
             Number of same species in current terrain before breeding season.
+        r: `float`, optional
+            Uniform random number in [0, 1) deciding fertilization.
+            Drawn by the animal if not given.
+        birth_weight: `float`, optional
+            Gaussian birth weight of the baby. Drawn by the animal if not given.
 
         Returns
         -------
         birth_weight: `float` or `bool`
             Birth weight of animal if birth takes place, otherwise False.
         """
-        match_probability = min(1, self.params['gamma'] * self.fitness * (number_of_animals - 1))
-        r = uniform(0, 1)
-
-        fertilization = r < match_probability
-
-        reached_puberty = self.weight > self.params['zeta'] * \
-                          (self.params['w_birth'] + self.params['sigma_birth'])
+        if not self.can_give_birth(number_of_animals, r):
+            return False
 
-        birth_weight = gauss(self.params['w_birth'], self.params['sigma_birth'])
+        if birth_weight is None:
+            birth_weight = gauss(self.params['w_birth'], self.params['sigma_birth'])
         miscarriage = birth_weight < 0
 
         maternal_health = self.weight > birth_weight * self.params['xi']
-        if all((fertilization, reached_puberty, maternal_health, not miscarriage)):
+        if maternal_health and not miscarriage:
             return birth_weight
 
         return False
 
-    def giving_birth(self, species, number_of_animals):
+    def giving_birth(self, species, number_of_animals, r=None, birth_weight=None):
         """Animal gives birth and loses weight.
 
         Animal gives birth if requirements from :py:meth:`.probability_to_give_birth` are met.
@@ -269,13 +389,17 @@ class Animal:
             Animal of chosen species giving birth.
         number_of_animals: `int`
             Number of same species in current terrain before breeding season.
+        r: `float`, optional
+            See :py:meth:`.probability_to_give_birth`.
+        birth_weight: `float`, optional
+            See :py:meth:`.probability_to_give_birth`.
 
         Returns
         -------
         newborn: `obj` or None
             Class instance for the newborn animal if parent gives birth, otherwise None.
         """
-        birth_weight = self.probability_to_give_birth(number_of_animals)
+        birth_weight = self.probability_to_give_birth(number_of_animals, r, birth_weight)
 
         if birth_weight:
             if species == 'Herbivore':
@@ -288,7 +412,7 @@ class Animal:
 
         return None
 
-    def dies(self):
+    def dies(self, r=None):
         """Decide whether animal dies.
 
         Notes
@@ -297,6 +421,11 @@ class Animal:
             #. from starvation if its' weight is zero
             #. from sickness with probability :math:`\omega(1-\Phi)`
 
+        Parameters
+        ----------
+        r: `float`, optional
+            Uniform random number in [0, 1). Drawn by the animal if not given.
+
         Returns
         -------
         `bool`
@@ -305,7 +434,8 @@ class Animal:
         starvation = self.weight <= 0
 
         probability = self.params['omega'] * (1 - self.fitness)
-        r = uniform(0, 1)
+        if r is None:
+            r = uniform(0, 1)
         sickness = r < probability
 
         return any((starvation, sickness))
@@ -314,6 +444,8 @@ class Animal:
 class Herbivore(Animal):
     """Animal species adopting all methods from superclass Animal."""
 
+    __slots__ = ()
+
     species = 'Herbivore'
 
     _default_params = {
@@ -341,6 +473,8 @@ class Carnivore(Animal):
     """Animal species adopting all methods from superclass Animal,
     with its' own unique traits added."""
 
+    __slots__ = ()
+
     species = 'Carnivore'
 
     _default_params = {
@@ -376,7 +510,7 @@ class Carnivore(Animal):
         """
         return self.F_tilde < self.params['F']
 
-    def probability_to_kill(self, herb_fitness):
+    def probability_to_kill(self, herb_fitness, r=None):
         """Decide the carnivore's probability to kill a herbivore.
 
         Notes
@@ -398,26 +532,30 @@ class Carnivore(Animal):
         ----------
         herb_fitness: `float`
             Fitness of the herbivore the carnivore is currently hunting.
+        r: `float`, optional
+            Uniform random number in [0, 1). Drawn by the carnivore if not given,
+            but only if the carnivore is fitter than the herbivore.
 
         Returns
         -------
         `bool`
             True if the killing can take place, otherwise False.
         """
-        r = uniform(0, 1)
         fitness_diff = self.fitness - herb_fitness
 
         if self.fitness <= herb_fitness:
             return False
 
-        elif 0 < fitness_diff < self.params['DeltaPhiMax']:
+        if r is None:
+            r = uniform(0, 1)
+        if 0 < fitness_diff < self.params['DeltaPhiMax']:
             probability = fitness_diff / self.params['DeltaPhiMax']
         else:
             probability = 1
 
         return probability > r
 
-    def killing(self, herb_fitness, herb_weight):
+    def killing(self, herb_fitness, herb_weight, r=None):
         """Carnivore kills herbivore and eats it.
 
         Carnivore kills if requirements from :py:meth:`.probability_to_kill` are met,
@@ -434,6 +572,8 @@ class Carnivore(Animal):
             Fitness of herbivore
         herb_weight: `float`
             Weight of herbivore
+        r: `float`, optional
+            See :py:meth:`.probability_to_kill`.
 
         Returns
         -------
@@ -441,10 +581,91 @@ class Carnivore(Animal):
             True if carnivore kills, otherwise False.
         """
         if self.hungry():
-            if self.probability_to_kill(herb_fitness):
+            if self.probability_to_kill(herb_fitness, r):
                 self.eat(herb_weight)
                 return True
             else:
                 return False
         else:
             return False
+
+    def hunt(self, prey_fitness, prey_weight, alive, rng=None):
+        """Carnivore hunts herbivores sorted by ascending fitness.
+
+        Notes
+        ------
+        Gives the same kills as calling :py:meth:`.killing` on every living herbivore in order,
+        but stops as soon as the carnivore is no longer :py:meth:`.hungry` or no weaker
+        herbivore remains. Herbivores at or above the carnivore's fitness are skipped by
+        binary search. The weaker ones are tried in blocks of positions, each block twice as
+        long as the previous one, so the work and the random numbers drawn follow the attempts
+        made rather than the number of herbivores. After a kill the carnivore's fitness rises,
+        and the hunt goes on with the herbivores following the killed one in the block, using
+        their numbers already drawn.
+
+        An attempt is a herbivore for which the kill probability is used, i.e. every weaker
+        herbivore up to and including the killed one.
+
+        Parameters
+        ----------
+        prey_fitness: `ndarray`
+            Fitness of the herbivores, sorted in ascending order.
+        prey_weight: `ndarray`
+            Weight of the herbivores, in the same order.
+        alive: `ndarray` of `bool`
+            True for every herbivore still alive. Killed herbivores are set to False.
+        rng: `obj`, optional
+            NumPy random generator drawing one uniform number per living herbivore of a block.
+            Numbers left in the last block when the carnivore stops are not used.
+            If not given, one number is drawn per attempt by :py:meth:`.probability_to_kill`.
+
+        Returns
+        -------
+        num_kills: `int`
+            Number of herbivores killed.
+        num_attempts: `int`
+            Number of attempts made.
+        """
+        num_kills = 0
+        num_attempts = 0
+        delta_phi_max = self.params['DeltaPhiMax']
+        position, block = 0, 8
+        candidates, draws = np.empty(0, dtype=np.intp), np.empty(0)
+
+        while self.hungry():
+            if not candidates.size:
+                # Herbivores weaker than the carnivore lie before stop, which only grows
+                stop = int(prey_fitness.searchsorted(self.fitness, side='left'))
+                if position >= stop:
+                    break
+                end = min(position + block, stop)
+                candidates = position + alive[position:end].nonzero()[0]
+                position, block = end, 2 * block
+                if rng is not None:
+                    draws = rng.random(candidates.size)
+                continue
+
+            if rng is None:
+                first_kill = next((index for index, herb_fitness
+                                   in enumerate(prey_fitness[candidates].tolist())
+                                   if self.probability_to_kill(herb_fitness)), None)
+            else:
+                # min(diff / DeltaPhiMax, 1) > r is diff > r * DeltaPhiMax, as r < 1
+                kills = self.fitness - prey_fitness[candidates] > draws * delta_phi_max
+                first_kill = int(kills.argmax())
+                if not kills[first_kill]:
+                    first_kill = None
+
+            if first_kill is None:
+                num_attempts += candidates.size
+                candidates = candidates[:0]
+                continue
+
+            num_attempts += first_kill + 1
+            prey = candidates[first_kill]
+            alive[prey] = False
+            self.eat(float(prey_weight[prey]))
+            num_kills += 1
+            candidates, draws = candidates[first_kill + 1:], draws[first_kill + 1:]
+
+        return num_kills, int(num_attempts)
@@ -254,9 +254,23 @@ class Graphics(GraphicsParams):
                 self.weight_max = value['max']
                 self.weight_delta = value['delta']
 
+    @property
+    def histogram_edges(self):
+        """Bin edges of the histograms for age, weight and fitness (`dict` of `ndarray`, read-only).
+
+        Bins of width delta cover the range from zero to max, see :py:class:`.GraphicsParams`."""
+        return {'age': self._bin_edges(self.age_max, self.age_delta),
+                'weight': self._bin_edges(self.weight_max, self.weight_delta),
+                'fitness': self._bin_edges(self.fitness_max, self.fitness_delta)}
+
+    @staticmethod
+    def _bin_edges(max_value, delta):
+        """Return the edges of bins of width delta from zero to max_value (`ndarray`)."""
+        return np.linspace(0, max_value, int(max_value / delta) + 1)
+
     def _plot_histogram(self,
-                        histogram_herbivore_data,
-                        histogram_carnivore_data,
+                        histogram_herbivore_counts,
+                        histogram_carnivore_counts,
                         ax_age,
                         ax_weight,
                         ax_fitness):
@@ -264,10 +278,10 @@ class Graphics(GraphicsParams):
 
         Parameters
         ----------
-        histogram_herbivore_data: `ndarray`
-            Array with one column per property, and one row per animal
-        histogram_carnivore_data: `ndarray`
-            Array with one column per property, and one row per animal
+        histogram_herbivore_counts: `dict` of `ndarray`
+            Number of animals in every bin of :py:attr:`.histogram_edges`, for each property
+        histogram_carnivore_counts: `dict` of `ndarray`
+            Number of animals in every bin of :py:attr:`.histogram_edges`, for each property
         ax_age: `object`
             Axes to hold plot for age histogram.
         ax_weight: `object`
@@ -287,47 +301,21 @@ class Graphics(GraphicsParams):
         # Set colors for Herbivores and Carnivores respectively
         hist_colors = ['green', 'red']
 
-        herbivore_data = histogram_herbivore_data
-        carnivore_data = histogram_carnivore_data
-
-        if carnivore_data.shape == (0,):
-            carnivore_data = np.zeros(shape=(1, 3))
-        if herbivore_data.shape == (0,):
-            herbivore_data = np.zeros(shape=(1, 3))
-
-        ax_fitness.hist([herbivore_data[:, 2], carnivore_data[:, 2]],
-                        bins=int(self.fitness_max / self.fitness_delta),
-                        range=(0, self.fitness_max),
-                        histtype='step',
-                        stacked=False,
-                        fill=False,
-                        color=hist_colors,
-                        label=['Herbivore', 'Carnivore'])
+        axes = {'age': ax_age, 'weight': ax_weight, 'fitness': ax_fitness}
+        for key, edges in self.histogram_edges.items():
+            # Each bin's left edge weighted by its count redraws the binned histogram
+            axes[key].hist([edges[:-1], edges[:-1]],
+                           bins=edges,
+                           weights=[histogram_herbivore_counts[key],
+                                    histogram_carnivore_counts[key]],
+                           histtype='step',
+                           stacked=False,
+                           fill=False,
+                           color=hist_colors,
+                           label=['Herbivore', 'Carnivore'])
+            axes[key].set(xlim=(0, getattr(self, f'{key}_max')),
+                          title=key.capitalize())
         ax_fitness.legend(bbox_to_anchor=(1.01, 1))
-        ax_fitness.set(xlim=(0, self.fitness_max),
-                       title='Fitness')
-
-        ax_age.hist([herbivore_data[:, 0], carnivore_data[:, 0]],
-                    bins=int(self.age_max / self.age_delta),
-                    range=(0, self.age_max),
-                    histtype='step',
-                    stacked=False,
-                    fill=False,
-                    color=hist_colors,
-                    label=['Herbivore', 'Carnivore'])
-        ax_age.set(xlim=(0, self.age_max),
-                   title='Age')
-
-        ax_weight.hist([herbivore_data[:, 1], carnivore_data[:, 1]],
-                       bins=int(self.weight_max / self.weight_delta),
-                       range=(0, self.weight_max),
-                       histtype='step',
-                       stacked=False,
-                       fill=False,
-                       color=hist_colors,
-                       label=['Herbivore', 'Carnivore'])
-        ax_weight.set(xlim=(0, self.weight_max),
-                      title='Weight')
 
         return ax_age, ax_weight, ax_fitness
 
@@ -335,8 +323,8 @@ class Graphics(GraphicsParams):
                    heatmap_data_carnivore,
                    population_size_herbivore,
                    population_size_carnivore,
-                   histogram_data_herbivore,
-                   histogram_data_carnivore,
+                   histogram_counts_herbivore,
+                   histogram_counts_carnivore,
                    year):
         """Make grid with several plots.
 
@@ -352,10 +340,10 @@ class Graphics(GraphicsParams):
         population_size_carnivore: `object`
             One dimensional array containing the carnivores' population size for
             all simulated years.
-        histogram_data_herbivore: `object`
-            Array with one column per property, and one row per herbivore.
-        histogram_data_carnivore: `object`
-            Array with one column per property, and one row per carnivore.
+        histogram_counts_herbivore: `dict` of `ndarray`
+            Number of herbivores in every bin of :py:attr:`.histogram_edges`, for each property.
+        histogram_counts_carnivore: `dict` of `ndarray`
+            Number of carnivores in every bin of :py:attr:`.histogram_edges`, for each property.
         year: `int`
             Specifying the year being displayed in the grid
 
@@ -386,8 +374,8 @@ class Graphics(GraphicsParams):
         age_ax = plt.subplot(grid[6:8, 6:13])
         weight_ax = plt.subplot(grid[8:10, 6:13])
         fitness_ax = plt.subplot(grid[4:6, 6:13])
-        self._plot_histogram(histogram_data_herbivore,
-                             histogram_data_carnivore,
+        self._plot_histogram(histogram_counts_herbivore,
+                             histogram_counts_carnivore,
                              age_ax, weight_ax, fitness_ax)
 
         return fig
@@ -410,7 +398,7 @@ class Graphics(GraphicsParams):
 
     def show_grid(self, heatmap_data_herbivore, heatmap_data_carnivore,
                   population_size_herbivore, population_size_carnivore,
-                  histogram_data_herbivore, histogram_data_carnivore,
+                  histogram_counts_herbivore, histogram_counts_carnivore,
                   pause, year, show, save):
         """Show grid created by :py:meth:`._make_grid`.
 
@@ -426,10 +414,10 @@ class Graphics(GraphicsParams):
         population_size_carnivore: `object`
             One dimensional array containing the carnivores' population size for
             all simulated years.
-        histogram_data_herbivore: `object`
-            Array with one column per property, and one row per herbivore.
-        histogram_data_carnivore: `object`
-            Array with one column per property, and one row per carnivore.
+        histogram_counts_herbivore: `dict` of `ndarray`
+            Number of herbivores in every bin of :py:attr:`.histogram_edges`, for each property.
+        histogram_counts_carnivore: `dict` of `ndarray`
+            Number of carnivores in every bin of :py:attr:`.histogram_edges`, for each property.
         pause: `float`
             Specification of time the figure is displayed.
         year: `int`
@@ -441,7 +429,7 @@ class Graphics(GraphicsParams):
         """
         fig = self._make_grid(heatmap_data_herbivore, heatmap_data_carnivore,
                               population_size_herbivore, population_size_carnivore,
-                              histogram_data_herbivore, histogram_data_carnivore, year)
+                              histogram_counts_herbivore, histogram_counts_carnivore, year)
         if show:
             plt.pause(pause)
             logger.info('Grid displayed')
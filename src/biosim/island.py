@@ -1,12 +1,23 @@
 import numpy as np
 from random import choice
 
-from biosim.landscape import Landscape
+from biosim.animals import Herbivore, Carnivore
+from biosim.landscape import Landscape, ColumnarLandscape
+from biosim.population import SpeciesLayout
 
 
 class Island:
     """An island with unique geography and evolution.
 
+    Notes
+    -----
+    The island keeps the number of animals of every cell, and only visits occupied cells
+    in the annual cycle and migration, see :py:meth:`.occupied_cells`. Animals must
+    therefore be added with :py:meth:`.add_population_in_location`. If a cell is changed
+    through its own methods instead, e.g. with :py:meth:`.Landscape.add_animals` or by
+    assigning its population, :py:meth:`.update_occupied` must be called with the cell
+    afterwards, else its animals are skipped.
+
     Attributes
     ----------
     base_map: `ndarray` of `str`
@@ -15,18 +26,108 @@ class Island:
         Island map presenting migratable locations.
     object_map: `ndarray` of `obj`
         Island map consisting of :py:class:`.Landscape` object references.
+    fodder_map: `ndarray` of `float`
+        Fodder available in every cell.
+    f_max_map: `ndarray` of `float`
+        Yearly fodder of every cell.
+    occupied_map: `ndarray` of `bool`
+        Cells holding at least one animal.
+    num_animals: `int`
+        Number of animals on the island.
+    num_animals_per_species: `dict`
+        Number of animals of each species on the island.
+    neighbours: `ndarray` of `int`
+        Destination cell of every cell for each migration direction.
 
     Parameters
     -----------
     island_map: `str`
         String of {'W', 'D', 'L', 'H'} mapping the entire island's geography.
+    backend: {'object', 'columnar', 'csr'}, optional
+        Population storage of the landscapes, see :py:class:`.Landscape` and
+        :py:class:`.ColumnarLandscape`. 'csr' stores animals like 'columnar', but
+        each species additionally lives in one island-wide :py:class:`.SpeciesLayout`,
+        and the columns of every cell are views of it, see :py:meth:`.rebuild_layout`.
+    rng: `obj`, optional
+        NumPy random generator shared by the island and all its landscapes.
+        If None, the animals draw their own random numbers.
+    migration: {'cellwise', 'vectorized'}, optional
+        Migration engine. 'cellwise' decides migration cell by cell, while 'vectorized'
+        decides it for all animals of the island at once, see
+        :py:meth:`._do_vectorized_migration`. 'vectorized' requires the 'columnar' or 'csr'
+        backend, and creates an unseeded generator if rng is not given.
     """
 
-    def __init__(self, island_map):
+    _landscape_classes = {'object': Landscape, 'columnar': ColumnarLandscape,
+                          'csr': ColumnarLandscape}
+    _migration_engines = ('cellwise', 'vectorized')
+
+    # Column of each migration direction in the neighbour table, with its row and column step
+    _directions = {'N': (0, -1, 0), 'S': (1, 1, 0), 'E': (2, 0, 1), 'W': (3, 0, -1)}
+
+    # Row of each species in the count arrays
+    _count_rows = {'Herbivore': 0, 'Carnivore': 1}
+
+    # Species read from storage by the property map methods
+    _density_map_species = {'v_size_herb_pop': 'Herbivore', 'v_size_carn_pop': 'Carnivore'}
+    _properties_map_species = {'v_herb_properties_objects': 'Herbivore',
+                               'v_carn_properties_objects': 'Carnivore'}
+
+    def __init__(self, island_map, backend='object', rng=None, migration='cellwise'):
+        if backend not in self._landscape_classes:
+            raise ValueError(f'{backend} is not a defined backend. '
+                             f'Defined backends are: {list(self._landscape_classes)}')
+        if migration not in self._migration_engines:
+            raise ValueError(f'{migration} is not a defined migration engine. '
+                             f'Defined migration engines are: {list(self._migration_engines)}')
+        if migration == 'vectorized':
+            if backend == 'object':
+                raise ValueError('Vectorized migration requires the columnar or csr backend.')
+            if rng is None:
+                rng = np.random.default_rng()
+        self._backend = backend
+        self._migration = migration
+        self._rng = rng
         self._base_map = self._make_base_map(island_map)
         self._migrate_map = self._make_migrate_map()
         self._object_map = self._make_object_map()
 
+        # Fodder of all cells in one array, each landscape bound to its element in row order
+        self._fodder = np.zeros(self._base_map.size)
+        for index, landscape in enumerate(self._object_map.flat):
+            landscape.bind_fodder(self._fodder, index)
+        self._f_max_table = None
+        self._f_max = None
+
+        # Landscapes in row order, and which of them hold animals
+        self._landscapes = self._object_map.ravel()
+        self._cell_indices = {landscape: index for index, landscape in enumerate(self._landscapes)}
+        self._occupied = np.zeros(self._base_map.size, dtype=bool)
+        self._counts = np.zeros((len(self._count_rows), self._base_map.size), dtype=np.int64)
+        self._totals = np.zeros(len(self._count_rows), dtype=np.int64)
+        self._neighbours = self._make_neighbours()
+
+        # Cells of each land type, as masks and as index arrays in row order
+        self._type_masks = {letter: self._base_map.ravel() == letter for letter in 'LHD'}
+        self._land_cells = {letter: np.flatnonzero(mask)
+                            for letter, mask in self._type_masks.items()}
+
+        if backend == 'csr':
+            self._layouts = {species.species: SpeciesLayout(species, self._base_map.size)
+                             for species in (Herbivore, Carnivore)}
+        else:
+            self._layouts = None
+
+    @property
+    def backend(self):
+        """Population storage of the landscapes ({'object', 'columnar', 'csr'}, read-only)."""
+        return self._backend
+
+    @property
+    def migration(self):
+        """Migration engine ({'cellwise', 'vectorized'}, read-only)."""
+        return self._migration
+
     @property
     def base_map(self):
         """Map of island consisting of landscape letters (`ndarray` of `str`)."""
@@ -42,6 +143,271 @@ class Island:
         """Map of island consisting of landscape-object references (`ndarray` of `obj`)."""
         return self._object_map
 
+    @property
+    def fodder_map(self):
+        """Map of fodder available in every cell (`ndarray` of `float`, read-only).
+
+        A view of the island's fodder array, so it follows grassing and regrowth."""
+        return self._fodder.reshape(self._base_map.shape)
+
+    @property
+    def f_max_map(self):
+        """Map of yearly fodder in every cell (`ndarray` of `float`, read-only).
+
+        Derived from :py:attr:`.base_map`, and rebuilt after the landscape
+        parameters are changed."""
+        return self._f_max_flat().reshape(self._base_map.shape)
+
+    @property
+    def occupied_map(self):
+        """Map of cells holding at least one animal (`ndarray` of `bool`, read-only).
+
+        Updated when animals are added or migrate, and by :py:meth:`.update_occupied`."""
+        return self._occupied.reshape(self._base_map.shape)
+
+    @property
+    def num_animals(self):
+        """Number of animals on the island (`int`, read-only)."""
+        return int(self._totals.sum())
+
+    @property
+    def num_animals_per_species(self):
+        """Number of animals of each species on the island (`dict`, read-only)."""
+        return {species: int(self._totals[row]) for species, row in self._count_rows.items()}
+
+    def count_map(self, species):
+        """Number of animals of a species in every cell.
+
+        Notes
+        -----
+        The counts are kept by the island when animals are added or migrate, and
+        by :py:meth:`.update_occupied` after births and deaths.
+        The map is a read-only view of them, and follows later updates.
+
+        Parameters
+        ----------
+        species: {'Herbivore', 'Carnivore'}
+            Species to count.
+
+        Returns
+        -------
+        `ndarray` of `int`
+            Array with the shape of the island.
+        """
+        count_map = self._counts[self._count_rows[species]].reshape(self._base_map.shape)
+        count_map.flags.writeable = False
+        return count_map
+
+    def density_map(self, species, out=None):
+        """Number of animals of a species in every cell, as floats.
+
+        Parameters
+        ----------
+        species: {'Herbivore', 'Carnivore'}
+            Species to count.
+        out: `ndarray`, optional
+            Preallocated array with the shape of the island to write into.
+
+        Returns
+        -------
+        `ndarray` of `float`
+            Array with the shape of the island, out if given.
+        """
+        if out is None:
+            out = np.empty(self._base_map.shape)
+        np.copyto(out, self.count_map(species))
+        return out
+
+    def species_properties(self, species, out=None):
+        """Age, weight and fitness of every animal of a species, cell by cell in row order.
+
+        Notes
+        -----
+        Rows are written straight from the storage of every occupied cell, each cell's
+        animals placed after the ones of the cells before it. The number of animals is
+        taken from the cells themselves, so the result is correct even if the island's
+        counts were not updated after a cell changed, see :py:meth:`.update_occupied`.
+
+        Parameters
+        ----------
+        species: {'Herbivore', 'Carnivore'}
+            Species to collect.
+        out: `ndarray`, optional
+            Preallocated array of shape (at least number of animals, 3) to write into.
+
+        Raises
+        ------
+        ValueError
+            out has too few rows for the animals of the species.
+
+        Returns
+        -------
+        `ndarray` of `float`
+            Array of shape (number of animals, 3), a view of out if given.
+        """
+        landscapes = self._landscapes[self.occupied_cells()]
+        sizes = np.array([landscape.species_number(species) for landscape in landscapes],
+                         dtype=np.int64)
+        stops = np.cumsum(sizes)
+        num_animals = int(stops[-1]) if stops.size else 0
+        if out is None:
+            out = np.empty((num_animals, 3))
+        elif out.shape[0] < num_animals:
+            raise ValueError(f'out holds {out.shape[0]} rows, but the island holds '
+                             f'{num_animals} animals of species {species}.')
+
+        for landscape, start, stop in zip(landscapes, stops - sizes, stops):
+            if stop > start:
+                landscape.species_properties(species, out[start:stop])
+
+        return out[:num_animals]
+
+    @property
+    def layouts(self):
+        """Island-wide storage of each species, or None unless the backend is 'csr'
+        (`dict` of :py:class:`.SpeciesLayout`, read-only)."""
+        return self._layouts
+
+    def rebuild_layout(self):
+        """Gather all animals into the island-wide layouts, and bind every cell to views of them.
+
+        Only used by the 'csr' backend, after animals were added or removed in the cells.
+        """
+        cells = self.occupied_cells()
+        landscapes = self._landscapes[cells]
+        for species, layout in self._layouts.items():
+            columns = [landscape.columns[species] for landscape in landscapes]
+            layout.gather(cells, columns)
+            layout.scatter(cells, columns)
+
+    @property
+    def neighbours(self):
+        """Destination cell index of every cell for directions N, S, E and W
+        (`ndarray` of `int`, read-only).
+
+        Cells are indexed in row order, and one row holds the destinations of one cell.
+        Where the neighbour is water, the destination is the cell itself."""
+        return self._neighbours
+
+    def _make_neighbours(self):
+        """Create the neighbour table, see :py:attr:`.neighbours`.
+
+        Returns
+        -------
+        `ndarray` of `int`
+            Array of shape (number of cells, 4).
+        """
+        num_rows, num_cols = self._base_map.shape
+        cells = np.arange(self._base_map.size)
+        rows, cols = np.divmod(cells, num_cols)
+        migratable = self._migrate_map.ravel()
+
+        neighbours = np.empty((cells.size, len(self._directions)), dtype=np.intp)
+        for column, row_step, col_step in self._directions.values():
+            target_rows, target_cols = rows + row_step, cols + col_step
+            inside = ((0 <= target_rows) & (target_rows < num_rows) &
+                      (0 <= target_cols) & (target_cols < num_cols))
+            targets = np.where(inside, target_rows * num_cols + target_cols, cells)
+            neighbours[:, column] = np.where(migratable[targets], targets, cells)
+
+        return neighbours
+
+    def land_cells(self, landscape_types='LHD'):
+        """Indices of the cells of the given land types in row order.
+
+        Parameters
+        ----------
+        landscape_types: `str`, optional
+            Landscape letters out of 'L', 'H' and 'D'.
+
+        Returns
+        -------
+        `ndarray` of `int`
+            Cell indices.
+        """
+        if len(landscape_types) == 1:
+            return self._land_cells[landscape_types]
+        return np.flatnonzero(self._types_mask(landscape_types))
+
+    def _types_mask(self, landscape_types):
+        """Return a mask of the cells of the given land types (`ndarray` of `bool`)."""
+        mask = np.zeros(self._base_map.size, dtype=bool)
+        for letter in landscape_types:
+            mask |= self._type_masks[letter]
+        return mask
+
+    def occupied_cells(self, landscape_types=None):
+        """Indices of occupied cells in row order.
+
+        Cells changed through their own methods are only included after
+        :py:meth:`.update_occupied`, see :py:class:`.Island`.
+
+        Parameters
+        ----------
+        landscape_types: `str`, optional
+            Only cells of these landscape letters, see :py:meth:`.land_cells`.
+
+        Returns
+        -------
+        `ndarray` of `int`
+            Cell indices.
+        """
+        if landscape_types is None:
+            return np.flatnonzero(self._occupied)
+        return np.flatnonzero(self._occupied & self._types_mask(landscape_types))
+
+    def occupied_landscapes(self, landscape_types=None):
+        """Landscapes holding at least one animal, in row order.
+
+        Parameters
+        ----------
+        landscape_types: `str`, optional
+            Only landscapes of these landscape letters, see :py:meth:`.land_cells`.
+
+        Returns
+        -------
+        `ndarray` of `obj`
+            Landscapes.
+        """
+        return self._landscapes[self.occupied_cells(landscape_types)]
+
+    def update_occupied(self, cells=None):
+        """Recount the animals in cells, and recheck whether they hold animals,
+        e.g. after births and deaths, or after animals were added to a cell directly.
+
+        Parameters
+        ----------
+        cells: `ndarray` of `int`, optional
+            Indices of the cells to recheck. All occupied cells if not given.
+        """
+        if cells is None:
+            cells = self.occupied_cells()
+        counts = np.array([(landscape.herbivores_number, landscape.carnivores_number)
+                           for landscape in self._landscapes[cells]],
+                          dtype=np.int64).reshape(-1, len(self._count_rows)).T
+        self._totals += counts.sum(axis=1) - self._counts[:, cells].sum(axis=1)
+        self._counts[:, cells] = counts
+        self._occupied[cells] = counts.sum(axis=0) > 0
+
+    def _f_max_flat(self):
+        """Return f_max for every cell in row order, rebuilding it if parameters changed."""
+        f_max_table = Landscape._f_max_lookup()
+        if f_max_table is not self._f_max_table:
+            self._f_max = np.array([f_max_table[letter] for letter in self._base_map.flat],
+                                   dtype=float)
+            self._f_max_table = f_max_table
+
+        return self._f_max
+
+    def regrowth(self):
+        """Reset fodder in all cells to their maximum with one array copy.
+
+        See Also
+        --------
+        :py:meth:`.Landscape.regrowth`
+        """
+        np.copyto(self._fodder, self._f_max_flat())
+
     def _validate_island_map(self, island_map):
         """Validate correct setup of island map string.
 
@@ -119,8 +485,8 @@ class Island:
             Array containing landscape objects in their respective positions.
         """
         object_map = np.empty(self._base_map.shape, dtype='object')
-        vLandscape = np.vectorize(Landscape)
-        object_map[:, :] = vLandscape(self._base_map)
+        vLandscape = np.vectorize(self._landscape_classes[self._backend], excluded={'rng'})
+        object_map[:, :] = vLandscape(self._base_map, rng=self._rng)
 
         return object_map
 
@@ -159,60 +525,201 @@ class Island:
 
             population = dictionary['pop']
             landscape_object.add_animals(population)
+            self.update_occupied([row * max_col + col])
+
+        if self._layouts:
+            self.rebuild_layout()
 
     def do_migration(self):
-        """Migrate all animals in all terrains."""
-        global_migrated_animals = []
-        with np.nditer(self.object_map, flags=['multi_index', 'refs_ok']) as it:
-            for grid_cell in it:
-                current_location = grid_cell.item()
+        """Migrate all animals in all terrains.
+
+        Notes
+        -----
+        Only cells occupied when migration starts are visited. Emigrants are collected
+        in an incoming buffer per destination, and only moved in after every cell has
+        been visited, so every animal is considered exactly once and migration time is
+        linear in the number of animals. The occupied cells are updated afterwards.
+        """
+        if self._migration == 'vectorized':
+            self._do_vectorized_migration()
+            return
+        if self._backend != 'object':
+            self._do_columnar_migration()
+            if self._layouts:
+                self.rebuild_layout()
+            return
+
+        source_cells = self.occupied_cells()
+        incoming = {}
+        for cell in source_cells:
+            current_location = self._landscapes[cell]
+
+            population = current_location.population
+            draws, directions = self._migration_draws(len(population))
+            staying = []
+
+            for animal, r, direction in zip(population, draws, directions):
+                if migrate_to_location := self._get_migration_location(animal, cell,
+                                                                       r, direction):
+                    incoming.setdefault(migrate_to_location, []).append(animal)
+                else:
+                    staying.append(animal)
+
+            if len(staying) < len(population):
+                current_location.population = staying
+
+        for destination, immigrants in incoming.items():
+            for animal in immigrants:
+                destination.species_population(animal.species).append(animal)
+
+        self._update_occupied_after_migration(source_cells, incoming)
+
+    def _do_columnar_migration(self):
+        """Migrate all animals stored in :py:class:`.ColumnarLandscape` cells.
 
-                if current_location.population:
-                    local_migrated_animals = []
+        Notes
+        -----
+        All migration decisions are made cell by cell before any animal is moved,
+        so every animal is considered exactly once.
+        """
+        source_cells = self.occupied_cells()
+        departures = []
+        for cell in source_cells:
+            current_location = self._landscapes[cell]
+
+            for species, columns in current_location.columns.items():
+                if not len(columns):
+                    continue
+
+                draws, directions = self._migration_draws(len(columns))
+                destinations = [self._get_migration_location(animal, cell, r, direction)
+                                for animal, r, direction
+                                in zip(columns.views(), draws, directions)]
+                mask = np.array([bool(destination) for destination in destinations])
+                if mask.any():
+                    departures.append((current_location, species, mask,
+                                       [destination for destination in destinations
+                                        if destination]))
+
+        arrivals = {}
+        for current_location, species, mask, destinations in departures:
+            emigrants = current_location.emigrate({species: mask})[species]
+            for row, destination in enumerate(destinations):
+                arrivals.setdefault((destination, species), []).append(
+                    [attribute[row] for attribute in emigrants])
+
+        for (destination, species), rows in arrivals.items():
+            destination.immigrate(species, tuple(np.array(attribute) for attribute in zip(*rows)))
+
+        self._update_occupied_after_migration(source_cells,
+                                              {destination for destination, _ in arrivals})
+
+    def _update_occupied_after_migration(self, source_cells, destinations):
+        """Update occupied cells and counts after migration.
+
+        Parameters
+        ----------
+        source_cells: `ndarray` of `int`
+            Cells occupied before migration, rechecked since they may have emptied.
+        destinations: iterable of `obj`
+            Landscapes that received animals.
+        """
+        destination_cells = [self._cell_indices[destination] for destination in destinations]
+        self.update_occupied(np.union1d(source_cells, destination_cells).astype(np.intp))
 
-                    for animal in current_location.population:
-                        if animal not in global_migrated_animals:
+    def _do_vectorized_migration(self):
+        """Migrate all animals of the island at once.
 
-                            if migrate_to_location := self._get_migration_location(animal,
-                                                                                   it.multi_index):
-                                migrate_to_location.population.append(animal)
-                                local_migrated_animals.append(animal)
+        Notes
+        -----
+        For each species, herbivores before carnivores, all animals are gathered into a
+        :py:class:`.SpeciesLayout`, ordered by cell. One uniform array decides migration against
+        :math:`\\mu\\Phi`, and one integer array gives the direction as a column of
+        :py:attr:`.neighbours`. Animals are then regrouped by destination with a counting
+        sort, see :py:meth:`.SpeciesLayout.regroup`, and every touched cell is bound to its
+        slice. The per-cell counts and occupied cells follow from the layout.
+
+        With the 'csr' backend the island's own layouts are used, otherwise temporary ones.
+        """
+        source_cells = self.occupied_cells()
+        source_landscapes = self._landscapes[source_cells]
+        for species in (Herbivore, Carnivore):
+            if self._layouts:
+                layout = self._layouts[species.species]
+            else:
+                layout = SpeciesLayout(species, self._base_map.size)
+            layout.gather(source_cells, [landscape.columns[species.species]
+                                         for landscape in source_landscapes])
+            if len(layout):
+                sources = layout.cells()
+                migrates = self._rng.random(sources.size) < species.params['mu'] * layout.fitness
+                directions = self._rng.integers(len(self._directions), size=sources.size)
+                layout.regroup(np.where(migrates, self._neighbours[sources, directions], sources))
+
+                touched_cells = np.union1d(source_cells, np.flatnonzero(layout.cell_sizes()))
+                layout.scatter(touched_cells, [landscape.columns[species.species]
+                                               for landscape in self._landscapes[touched_cells]])
+
+            # Hunting may have changed the counts since they were last updated
+            cell_sizes = layout.cell_sizes()
+            row = self._count_rows[species.species]
+            self._totals[row] += cell_sizes.sum() - self._counts[row].sum()
+            self._counts[row] = cell_sizes
+
+        self._occupied[:] = self._counts.sum(axis=0) > 0
+
+    def _migration_draws(self, size):
+        """Draw random numbers deciding migration for a block of animals.
 
-                    for animal in local_migrated_animals:
-                        current_location.population.remove(animal)
+        Parameters
+        ----------
+        size: `int`
+            Number of animals.
 
-                    global_migrated_animals += local_migrated_animals
+        Returns
+        -------
+        draws: `ndarray` or `list`
+            Uniform numbers deciding whether each animal migrates.
+        directions: `ndarray` or `list`
+            Direction letter in 'NSEW' for each animal.
 
-    def _get_migration_location(self, animal, location_coordinates):
+            Both are lists of None if no generator is set.
+        """
+        if self._rng is None:
+            return [None] * size, [None] * size
+        return self._rng.random(size), np.array(list('NSEW'))[self._rng.integers(4, size=size)]
+
+    def _get_migration_location(self, animal, cell, r=None, direction=None):
         """Find final destination for a migrating animal.
 
         Parameters
         ----------
         animal: `obj`
             migrating animal
-        location_coordinates: `tuple`
-            Row and column of current position
+        cell: `int`
+            Index of current position in row order.
+        r: `float`, optional
+            Uniform random number deciding migration, see :py:meth:`.probability_to_migrate`.
+        direction: {'N', 'S', 'E', 'W'}, optional
+            Direction of migration. Chosen at random if not given.
 
         Returns
         -------
         `obj` or `bool`
             Return landscape cell reference if requirements are met, or return False.
+
+        See Also
+        --------
+        :py:attr:`.neighbours`
         """
-        r, c = location_coordinates
-        view = self.migrate_map[r-1:r+2, c-1:c+2]
-
-        if animal.probability_to_migrate():
-            direction = choice('NSEW')
-            mask = np.array([[False, direction == 'N', False],
-                             [direction == 'W', False, direction == 'E'],
-                             [False, direction == 'S', False]])
-            destination = self.object_map[r - 1:r + 2, c - 1:c + 2][view & mask]
-            if destination.size > 0:
-                return destination.item()
-            else:
-                return False
-        else:
-            return False
+        if animal.probability_to_migrate(r):
+            if direction is None:
+                direction = choice('NSEW')
+            destination = self._neighbours[cell, self._directions[direction][0]]
+            if destination != cell:
+                return self._landscapes[destination]
+
+        return False
 
     def get_property_map(self, fx_map_type):
         """User interface that provides mapped values from specified methods of the class.
@@ -221,6 +728,9 @@ class Island:
         -----
         Function takes method :py:meth:`.v_size_herb_pop` or :py:meth:`.v_size_carn_pop` as input
         and provides a map of the respective populations sizes for every cell on the island.
+        These two are read by :py:meth:`.density_map` after all cells are recounted,
+        see :py:meth:`.update_occupied`, while other methods are vectorized over
+        :py:attr:`.object_map`.
 
         Parameters
         ----------
@@ -231,6 +741,9 @@ class Island:
         `ndarray`
             Array mapping chosen property
         """
+        if fx_map_type in self._density_map_species:
+            self.update_occupied(np.arange(self._base_map.size))
+            return self.density_map(self._density_map_species[fx_map_type])
         return self._make_property_map(getattr(self, fx_map_type))
 
     def _make_property_map(self, fx):
@@ -300,6 +813,9 @@ class Island:
         Function takes method :py:meth:`.v_herb_properties_objects`
         or :py:meth:`.v_carn_properties_objects` as input and provides full exposure of
         the respective animals' attributes age, weight and fitness for every cell on the island.
+        These two are read from the cells' storage by :py:meth:`.species_properties` after
+        all cells are recounted, see :py:meth:`.update_occupied`, while other methods are
+        vectorized over :py:attr:`.object_map`.
 
         Parameters
         ----------
@@ -311,8 +827,33 @@ class Island:
         `ndarray`
             Array mapping attributes of chosen species.
         """
+        if fx_map_type in self._properties_map_species:
+            self.update_occupied(np.arange(self._base_map.size))
+            return self._split_species_properties(self._properties_map_species[fx_map_type])
         return self._make_property_map_objects(getattr(self, fx_map_type))
 
+    def _split_species_properties(self, species):
+        """Map the rows of :py:meth:`.species_properties` to their cells
+        for :py:meth:`.get_property_map_objects`.
+
+        Parameters
+        ----------
+        species: {'Herbivore', 'Carnivore'}
+            Species to collect.
+
+        Returns
+        -------
+        `ndarray` of `obj`
+            List of (age, weight, fitness) tuples for every cell holding the species, else None.
+        """
+        property_map = np.full(self._base_map.shape, None, dtype=object)
+        counts = self._counts[self._count_rows[species]]
+        cells = np.flatnonzero(counts)
+        rows = np.split(self.species_properties(species), np.cumsum(counts[cells])[:-1])
+        for cell, cell_rows in zip(cells, rows):
+            property_map.flat[cell] = [tuple(attributes) for attributes in cell_rows.tolist()]
+        return property_map
+
     def _make_property_map_objects(self, fx):
         """Create mapping of a chosen species' attribuets for :py:meth:`.get_property_map_objects`.
 
@@ -1,7 +1,72 @@
+import sys
+from itertools import chain
 from random import sample
 from copy import deepcopy
 
+import numpy as np
+
 from biosim.animals import Animal, Herbivore, Carnivore
+from biosim.population import SpeciesColumns
+
+
+def _writes_back(method):
+    """Wrap a mutating list method of :py:class:`.PopulationList` to update the landscape."""
+    def wrapper(self, *args):
+        result = method(self, *args)
+        self._landscape.population = self
+        return result
+
+    wrapper.__name__ = method.__name__
+    wrapper.__doc__ = method.__doc__
+    return wrapper
+
+
+def _adds_to(method):
+    """Wrap a list method of :py:class:`.PopulationList` adding animals at its end,
+    to add only them to the landscape."""
+    def wrapper(self, *args):
+        num_animals = len(self)
+        result = method(self, *args)
+        self._landscape._add_to_population(self[num_animals:])
+        return result
+
+    wrapper.__name__ = method.__name__
+    wrapper.__doc__ = method.__doc__
+    return wrapper
+
+
+class PopulationList(list):
+    """List of all animals in a :py:class:`.Landscape`, herbivores before carnivores.
+
+    Notes
+    -----
+    The list is filled from the landscape's species containers. Every change to it,
+    e.g. appending or removing animals, is written back to the containers, so the list
+    behaves like the landscape's own population list. Appended animals are added to the
+    containers alone, while other changes replace the whole population.
+
+    Parameters
+    ----------
+    landscape: `obj`
+        Landscape whose population is listed.
+    """
+
+    def __init__(self, landscape):
+        super().__init__(chain(landscape.herbivores, landscape.carnivores))
+        self._landscape = landscape
+
+    append = _adds_to(list.append)
+    extend = _adds_to(list.extend)
+    insert = _writes_back(list.insert)
+    remove = _writes_back(list.remove)
+    pop = _writes_back(list.pop)
+    clear = _writes_back(list.clear)
+    sort = _writes_back(list.sort)
+    reverse = _writes_back(list.reverse)
+    __setitem__ = _writes_back(list.__setitem__)
+    __delitem__ = _writes_back(list.__delitem__)
+    __iadd__ = _adds_to(list.__iadd__)
+    __imul__ = _writes_back(list.__imul__)
 
 
 class Landscape:
@@ -17,13 +82,21 @@ class Landscape:
         Fodder currently available.
     f_max: `int` or `float`
         Total amount of fodder available.
-    population: `list`
-        All animals in current landscape.
+    population: :py:class:`.PopulationList`
+        All animals in current landscape, herbivores before carnivores.
+    rng: `obj` or None
+        NumPy random generator used for all random decisions in the landscape.
+        If None, every animal draws its own random numbers.
+    skipped_attempts: `int`
+        Hunting attempts saved by :py:meth:`.Carnivore.hunt` since the landscape was created,
+        compared to every carnivore trying every living herbivore.
 
     Parameters
     ----------
     landscape_type: {'L', 'H', 'D', 'W'}
         Terrain describing the landscape cell.
+    rng: `obj`, optional
+        NumPy random generator, see Attributes.
     """
 
     _default_params = {'f_max': {'Highland': 300.0, 'Lowland': 800.0}}
@@ -31,11 +104,16 @@ class Landscape:
     # Changeable parameters values by option set to default values
     params = deepcopy(_default_params)
 
-    def __init__(self, landscape_type):
+    # f_max per landscape letter, rebuilt from params after set_params
+    _f_max_table = None
+
+    def __init__(self, landscape_type, rng=None):
         self._landscape_type = landscape_type
-        self._f_max = None
-        self._fodder = self.f_max
-        self._population = []
+        self._fodder_array = np.array([self.f_max], dtype=float)
+        self._fodder_index = 0
+        self._species_populations = {'Herbivore': [], 'Carnivore': []}
+        self.rng = rng
+        self.skipped_attempts = 0
 
     @classmethod
     def set_params(cls, new_params):
@@ -54,6 +132,25 @@ class Landscape:
         if 'Lowland' in param_dict:
             cls.params['f_max']['Lowland'] = param_dict['Lowland']
 
+        # Stored on Landscape, so subclasses sharing params never keep a stale table
+        Landscape._f_max_table = None
+
+    @classmethod
+    def _f_max_lookup(cls):
+        """Return f_max for every landscape letter, building the table if invalidated.
+
+        Returns
+        -------
+        `dict`
+            f_max keyed by landscape letter.
+        """
+        if Landscape._f_max_table is None:
+            Landscape._f_max_table = {'H': cls.params['f_max']['Highland'],
+                                      'L': cls.params['f_max']['Lowland'],
+                                      'D': 0,
+                                      'W': 0}
+        return Landscape._f_max_table
+
     @property
     def landscape_type(self):
         """The object's landscape type ({'L', 'H', 'D', 'W'}, read-only).
@@ -66,59 +163,213 @@ class Landscape:
         """Total amount of fodder available every year in one terrain (`int` or `float`).
 
         :math:`\mathtt{f\_max}` is changeable by option for landscapes Lowland and Highland,
-        but set to zero for Desert and Water."""
-        if self.landscape_type == 'H':
-            self._f_max = self.params['f_max']['Highland']
-        elif self.landscape_type == 'L':
-            self._f_max = self.params['f_max']['Lowland']
-        else:
-            self._f_max = 0
-
-        return self._f_max
+        but set to zero for Desert and Water. Looked up in a table cached per landscape type,
+        which :py:meth:`.set_params` invalidates."""
+        return self._f_max_lookup()[self._landscape_type]
 
     @property
     def fodder(self):
-        """Fodder available in current landscape (`int` or `float`)."""
-        return self._fodder
+        """Fodder available in current landscape (`float`).
+
+        Stored as one element of a `float` array, see :py:meth:`.bind_fodder`."""
+        return float(self._fodder_array[self._fodder_index])
 
     @fodder.setter
     def fodder(self, value):
         if value > self.f_max:
             raise ValueError('Value must be below f_max')
-        self._fodder = value
+        self._fodder_array[self._fodder_index] = value
+
+    def bind_fodder(self, fodder_array, index):
+        """Store the landscape's fodder in an element of a shared array.
+
+        The current fodder is copied into the array, and from then on the landscape
+        reads and writes its fodder only there.
+
+        Parameters
+        ----------
+        fodder_array: `ndarray` of `float`
+            One-dimensional array holding the fodder of many landscapes.
+        index: `int`
+            Element of fodder_array belonging to the landscape.
+        """
+        fodder_array[index] = self.fodder
+        self._fodder_array = fodder_array
+        self._fodder_index = index
 
     @property
     def population(self):
-        """All animals in current landscape (`list`)."""
-        return self._population
+        """All animals in current landscape, herbivores before carnivores
+        (:py:class:`.PopulationList`).
+
+        Changes to the list, e.g. appending or removing animals, change the species'
+        containers. Assigning a list of animals sorts them into the containers."""
+        return PopulationList(self)
 
     @population.setter
     def population(self, value):
-        self._population = value
+        species_populations = {species: [] for species in self._species_populations}
+        for animal in value:
+            species_populations[animal.species].append(animal)
+        self._species_populations = species_populations
+
+    def _add_to_population(self, animals):
+        """Add animals to the containers of their species, see :py:class:`.PopulationList`.
+
+        Parameters
+        ----------
+        animals: `list` of `obj`
+            Animals to add.
+        """
+        for animal in animals:
+            self._species_populations[animal.species].append(animal)
 
     @property
     def herbivores(self):
-        """All animals of species Herbivore in current landscape (`list`, read-only)."""
-        herbivores = [animal for animal in self.population if animal.species == 'Herbivore']
-        return herbivores
+        """All animals of species Herbivore in current landscape (`list`).
+
+        The landscape's own container is returned, so changes to it change the landscape."""
+        return self._species_populations['Herbivore']
+
+    @herbivores.setter
+    def herbivores(self, value):
+        self._species_populations['Herbivore'] = value
 
     @property
     def carnivores(self):
-        """All animals of species Carnivore in current landscape (`list`, read-only)."""
-        carnivores = [animal for animal in self.population if animal.species == 'Carnivore']
-        return carnivores
+        """All animals of species Carnivore in current landscape (`list`).
+
+        The landscape's own container is returned, so changes to it change the landscape."""
+        return self._species_populations['Carnivore']
+
+    @carnivores.setter
+    def carnivores(self, value):
+        self._species_populations['Carnivore'] = value
 
     @property
     def herbivores_number(self):
         """The number of herbivores in current landscape (`int`, read-only)."""
-        herbivores_number = len(self.herbivores)
-        return herbivores_number
+        return len(self._species_populations['Herbivore'])
 
     @property
     def carnivores_number(self):
         """The number of carnivores in current landscape (`int`, read-only)."""
-        carnivores_number = len(self.carnivores)
-        return carnivores_number
+        return len(self._species_populations['Carnivore'])
+
+    def species_population(self, species):
+        """All animals of the given species in current landscape.
+
+        Parameters
+        ----------
+        species: {'Herbivore', 'Carnivore'}
+            Name of the species.
+
+        Returns
+        -------
+        `list`
+            Container of the species, see :py:attr:`.herbivores`.
+        """
+        return self._species_populations[species]
+
+    def species_number(self, species):
+        """The number of animals of the given species in current landscape.
+
+        Parameters
+        ----------
+        species: {'Herbivore', 'Carnivore'}
+            Name of the species.
+
+        Returns
+        -------
+        `int`
+            Number of animals, see :py:attr:`.herbivores_number`.
+        """
+        return len(self._species_populations[species])
+
+    def species_properties(self, species, out):
+        """Write age, weight and fitness of all animals of a species into an array.
+
+        Parameters
+        ----------
+        species: {'Herbivore', 'Carnivore'}
+            Name of the species.
+        out: `ndarray`
+            Array of shape (number of animals, 3), one row per animal.
+        """
+        out[:] = [(animal.age, animal.weight, animal.fitness)
+                  for animal in self._species_populations[species]]
+
+    def _uniforms(self, size):
+        """Draw a block of uniform random numbers in [0, 1) from :py:attr:`.rng`.
+
+        Parameters
+        ----------
+        size: `int`
+            Number of random numbers.
+
+        Returns
+        -------
+        `ndarray` or `list`
+            Random numbers, or a list of None if no generator is set.
+        """
+        if self.rng is None:
+            return [None] * size
+        return self.rng.random(size)
+
+    def _normals(self, mean, std, size):
+        """Draw a block of gaussian random numbers from :py:attr:`.rng`.
+
+        Parameters
+        ----------
+        mean: `float`
+            Mean of the distribution.
+        std: `float`
+            Standard deviation of the distribution.
+        size: `int`
+            Number of random numbers.
+
+        Returns
+        -------
+        `ndarray` or `list`
+            Random numbers, or a list of None if no generator is set.
+        """
+        if self.rng is None:
+            return [None] * size
+        return self.rng.normal(mean, std, size)
+
+    def _birth_draws(self, species, species_population):
+        """Draw the random numbers deciding the births of a species.
+
+        Notes
+        -----
+        With a random generator, one block of uniform numbers decides fertilization for
+        every animal, and one block of birth weights is drawn only for the animals that are
+        fertilized and have reached puberty, see :py:meth:`.can_give_birth`.
+        Without one, every animal draws its own numbers.
+
+        Parameters
+        ----------
+        species: `class`
+            Species of the animals.
+        species_population: `list`
+            All animals of the species in current landscape.
+
+        Returns
+        -------
+        `list` of `tuple`
+            Animal, uniform number and birth weight for every animal that may give birth.
+        """
+        if self.rng is None:
+            return [(animal, None, None) for animal in species_population]
+
+        num_animals = len(species_population)
+        draws = self._uniforms(num_animals)
+        candidates = [(animal, r) for animal, r in zip(species_population, draws.tolist())
+                      if animal.can_give_birth(num_animals, r)]
+        birth_weights = self._normals(species.params['w_birth'], species.params['sigma_birth'],
+                                      len(candidates))
+        return [(animal, r, birth_weight)
+                for (animal, r), birth_weight in zip(candidates, birth_weights.tolist())]
 
     def grassing(self):
         """Feed all herbivores and adjust available fodder.
@@ -126,57 +377,206 @@ class Landscape:
         Notes
         -----
         Herbivores eat in order of fitness until everyone is satisfied
-        or no more fodder is available.
+        or no more fodder is available. All intakes are calculated up front,
+        and available fodder is adjusted once.
+
+        See Also
+        --------
+        :py:meth:`.Animal.batch_intake`
         """
-        for animal in sorted(self.herbivores, key=lambda x: x.fitness, reverse=True):
-            animal.F_tilde = 0
-            eaten = animal.eat(self.fodder)
-            self.fodder -= eaten
+        eating_order = sorted(self.herbivores, key=lambda x: x.fitness, reverse=True)
+        intake = Herbivore.batch_intake(self._fodder_array[self._fodder_index],
+                                        len(eating_order))
 
-            if self.fodder <= 0:
+        for animal, eaten in zip(eating_order, intake.tolist()):
+            if eaten <= 0:
                 break
+            animal.F_tilde = 0
+            animal.eat(eaten)
+
+        self._fodder_array[self._fodder_index] -= intake.sum()
 
     def hunting(self):
         """Carnivores hunt herbivores.
 
         Adjust population of herbivores.
 
+        Notes
+        -----
+        Herbivores are kept in one array sorted by fitness, with a mask marking the
+        living ones, and each carnivore hunts them with :py:meth:`.Carnivore.hunt`.
+
+        With a random generator, the hunting order is one permutation, and each carnivore
+        then draws the uniform numbers for its attempts, see :py:meth:`.Carnivore.hunt`.
+
         See Also
         --------
-        :py:meth:`.killing`, :py:meth:`.probability_to_kill`
+        :py:meth:`.hunt`, :py:meth:`.killing`, :py:meth:`.probability_to_kill`
         """
-        hunting_order = sample(self.carnivores, self.carnivores_number)
-
         prey_order = sorted(self.herbivores, key=lambda x: x.fitness)
+        self._hunt(prey_order, np.array([prey.fitness for prey in prey_order], dtype=float))
+
+    def _hunt(self, prey_order, prey_fitness):
+        """Carnivores hunt the given herbivores, see :py:meth:`.hunting`.
+
+        Parameters
+        ----------
+        prey_order: `list`
+            All herbivores in current landscape, sorted by ascending fitness.
+        prey_fitness: `ndarray`
+            Fitness of the herbivores, in the same order.
+        """
+        if self.rng is None:
+            hunting_order = sample(self.carnivores, self.carnivores_number)
+        else:
+            carnivores = self.carnivores
+            hunting_order = [carnivores[index] for index in self.rng.permutation(len(carnivores))]
+
+        if hunting_order and prey_order:
+            prey_weight = np.array([prey.weight for prey in prey_order], dtype=float)
+            alive = np.ones(len(prey_order), dtype=bool)
+            num_living = len(prey_order)
+
+            for hunter in hunting_order:
+                hunter.F_tilde = 0
+                num_kills, num_attempts = hunter.hunt(prey_fitness, prey_weight, alive, self.rng)
+                self.skipped_attempts += num_living - num_attempts
+                num_living -= num_kills
+
+            prey_order = [prey for prey, survived in zip(prey_order, alive.tolist()) if survived]
+        else:
+            for hunter in hunting_order:
+                hunter.F_tilde = 0
+
+        self.herbivores = prey_order
+        self.carnivores = hunting_order
+
+    def feeding(self, regrow=True):
+        """Regrow fodder, let herbivores graze and carnivores hunt, with one fitness ordering.
+
+        Notes
+        -----
+        Follows the same rules as :py:meth:`.regrowth`, :py:meth:`.grassing` and
+        :py:meth:`.hunting` called one after another. Herbivores are sorted once by
+        descending fitness to graze. The reversed order is almost ascending after grazing,
+        as grazing only raises fitness, and is sorted again with a stable sort that runs in
+        close to linear time on such input, giving the prey order. Herbivores with equal
+        fitness are thereby offered to the carnivores in reverse order compared to
+        :py:meth:`.hunting`, otherwise the random numbers are drawn and used in the same order.
+
+        Parameters
+        ----------
+        regrow: `bool`, optional
+            Whether to regrow the fodder first. :py:class:`.BioSim` regrows the fodder of the
+            whole island at once, see :py:meth:`.Island.regrowth`, and passes False.
+        """
+        if regrow:
+            self.regrowth()
 
-        for hunter in hunting_order:
-            hunter.F_tilde = 0
+        herbivores = self.herbivores
+        fitness = self._fitness_of(herbivores)
+        eating_order = np.argsort(-fitness, kind='stable')
+        if herbivores and self._fodder_array[self._fodder_index] > 0:
+            fitness = self._graze(herbivores, eating_order)
 
-            survivors = [prey for prey in prey_order
-                         if not hunter.killing(prey.fitness, prey.weight)]
-            prey_order = survivors
+        prey_index = eating_order[::-1]
+        prey_index = prey_index[np.argsort(fitness[prey_index], kind='stable')]
+        self._hunt([herbivores[index] for index in prey_index], fitness[prey_index])
 
-        self.population = prey_order + hunting_order
+    def _fitness_of(self, herbivores):
+        """Return the fitness of the given herbivores (`ndarray`)."""
+        return np.array([animal.fitness for animal in herbivores], dtype=float)
+
+    def _graze(self, herbivores, eating_order):
+        """Let herbivores graze in the given order, see :py:meth:`.grassing`.
+
+        Parameters
+        ----------
+        herbivores: `list`
+            All herbivores in current landscape.
+        eating_order: `ndarray` of `int`
+            Indices of the herbivores by descending fitness.
+
+        Returns
+        -------
+        `ndarray`
+            Fitness of the herbivores after grazing.
+        """
+        intake = Herbivore.batch_intake(self._fodder_array[self._fodder_index], len(herbivores))
+
+        for index, eaten in zip(eating_order.tolist(), intake.tolist()):
+            if eaten <= 0:
+                break
+            herbivores[index].F_tilde = 0
+            herbivores[index].eat(eaten)
+
+        self._fodder_array[self._fodder_index] -= intake.sum()
+        return self._fitness_of(herbivores)
 
     def give_birth(self):
         """For each animal giving birth, update population.
 
+        Notes
+        -----
+        With a random generator, each species draws the numbers of
+        :py:meth:`._birth_draws`, herbivores before carnivores.
+
         See Also
         --------
         :py:meth:`.giving_birth`, :py:meth:`.probability_to_give_birth`
         """
-        def create_newborns(species, num_animals, species_list):
-            newborns = [newborn for individual in species_list if
-                        (newborn := individual.giving_birth(species, num_animals))]
+        def create_newborns(species, species_list):
+            num_animals = len(species_list)
+            newborns = [newborn for individual, r, birth_weight
+                        in self._birth_draws(species, species_list) if
+                        (newborn := individual.giving_birth(species.species, num_animals,
+                                                            r, birth_weight))]
             return newborns
 
-        herbivore_babies = create_newborns('Herbivore', self.herbivores_number, self.herbivores)
-        carnivore_babies = create_newborns('Carnivore', self.carnivores_number, self.carnivores)
+        herbivore_babies = create_newborns(Herbivore, self.herbivores)
+        carnivore_babies = create_newborns(Carnivore, self.carnivores)
 
         if herbivore_babies:
-            self.population += herbivore_babies
+            self.herbivores += herbivore_babies
         if carnivore_babies:
-            self.population += carnivore_babies
+            self.carnivores += carnivore_babies
+
+    def end_of_year(self):
+        """Give birth, age and remove dying animals, one species at a time.
+
+        Notes
+        -----
+        Gives the same rules as :py:meth:`.give_birth`, :py:meth:`.aging` and
+        :py:meth:`.do_death` called one after another: births depend on the number of
+        animals and the parent's fitness before aging, and newborns age and may die
+        in their first year.
+
+        With a random generator, each species, herbivores before carnivores, draws the numbers
+        of :py:meth:`._birth_draws`, i.e. one block of uniform numbers for births and one block
+        of birth weights for the animals that may give birth. It then draws one block of uniform
+        numbers for the deaths of the animals present at the start, followed by one block for
+        the deaths of the newborns.
+        """
+        for species in (Herbivore, Carnivore):
+            species_population = self._species_populations[species.species]
+            num_animals = len(species_population)
+            newborns = [newborn for animal, r_birth, birth_weight
+                        in self._birth_draws(species, species_population)
+                        if (newborn := animal.giving_birth(species.species, num_animals,
+                                                           r_birth, birth_weight))]
+
+            survivors = []
+            for animal, r_death in zip(species_population, self._uniforms(num_animals)):
+                animal.age_and_weightloss()
+                if not animal.dies(r_death):
+                    survivors.append(animal)
+
+            for newborn, r_death in zip(newborns, self._uniforms(len(newborns))):
+                newborn.age_and_weightloss()
+                if not newborn.dies(r_death):
+                    survivors.append(newborn)
+
+            self._species_populations[species.species] = survivors
 
     def aging(self):
         """Age all animals by one year.
@@ -185,8 +585,9 @@ class Landscape:
         --------
         :py:meth:`.age_and_weightloss`: Relationship
         """
-        for animal in self.population:
-            animal.age_and_weightloss()
+        for species_population in self._species_populations.values():
+            for animal in species_population:
+                animal.age_and_weightloss()
 
     def do_death(self):
         """Remove dying animals.
@@ -195,21 +596,53 @@ class Landscape:
         --------
         :py:meth:`probability_of_death`
         """
-        population = self.population
-        survivors = [animal for animal in population if not animal.dies()]
-
-        self.population = survivors
+        draws = iter(self._uniforms(self.herbivores_number + self.carnivores_number))
+        for species, species_population in self._species_populations.items():
+            self._species_populations[species] = [animal for animal, r
+                                                  in zip(species_population, draws)
+                                                  if not animal.dies(r)]
 
     def regrowth(self):
         """Reset available fodder in terrain to maximum.
 
         Regrowth of fodder initially every year.
         """
-        self.fodder = self.f_max
+        self._fodder_array[self._fodder_index] = self._f_max_lookup()[self._landscape_type]
+
+    def memory_usage(self):
+        """Estimate memory used by the landscape and its animals.
+
+        Returns
+        -------
+        cell_bytes: `int`
+            Bytes used by the landscape independently of the number of animals.
+        animal_bytes: `int`
+            Bytes used by the animals, including their attribute values.
+        """
+        empty_list_bytes = sys.getsizeof([])
+        cell_bytes = sys.getsizeof(self) + sys.getsizeof(vars(self)) + \
+            sys.getsizeof(self._species_populations)
+
+        animal_bytes = 0
+        for species_population in self._species_populations.values():
+            cell_bytes += empty_list_bytes
+            animal_bytes += sys.getsizeof(species_population) - empty_list_bytes
+            for animal in species_population:
+                animal_bytes += sys.getsizeof(animal)
+                animal_bytes += sum(sys.getsizeof(getattr(animal, slot))
+                                    for slot in Animal.__slots__)
+
+        return cell_bytes, animal_bytes
 
     def add_animals(self, added_pop):
         """Add animals to current location.
 
+        Notes
+        -----
+        On an island, add animals with :py:meth:`.Island.add_population_in_location`,
+        or call :py:meth:`.Island.update_occupied` afterwards, else the island does not
+        know the cell is occupied and skips its animals.
+
         Parameters
         ----------
         added_pop: `list` of `dict`
@@ -232,10 +665,357 @@ class Landscape:
             weight = animal['weight']
 
             if animal['species'] == 'Herbivore':
-                self.population += [Herbivore(weight, age)]
+                self.herbivores.append(Herbivore(weight, age))
             elif animal['species'] == 'Carnivore':
-                self.population += [Carnivore(weight, age)]
+                self.carnivores.append(Carnivore(weight, age))
             else:
                 raise ValueError(f'{animal} is not a defined animal.\n'
                                  f'Defined animals are: '
                                  f'{[cls.__name__ for cls in Animal.__subclasses__()]}')
+
+
+class ColumnarLandscape(Landscape):
+    """A landscape storing its animals column-wise instead of as one object per animal.
+
+    Notes
+    ------
+    Each species is kept in a :py:class:`.SpeciesColumns`, holding age, weight, fitness and
+    :math:`\\tilde{F}` as NumPy arrays. :py:attr:`.population`, :py:attr:`.herbivores` and
+    :py:attr:`.carnivores` return :py:class:`.AnimalView` objects reading from and writing to
+    these arrays, so all methods of :py:class:`.Landscape` are available unchanged.
+
+    The columns of a species are only created once animals of it are added, so empty cells
+    and water cells hold no columns.
+
+    Parameters
+    ----------
+    landscape_type: {'L', 'H', 'D', 'W'}
+        Terrain describing the landscape cell.
+    rng: `obj`, optional
+        NumPy random generator, see :py:class:`.Landscape`.
+        Vectorized phases need a generator, so an unseeded one is created on first use
+        if not given.
+    """
+
+    _species_classes = {'Herbivore': Herbivore, 'Carnivore': Carnivore}
+
+    def __init__(self, landscape_type, rng=None):
+        super().__init__(landscape_type, rng)
+        self._columns = {}
+
+    @property
+    def rng(self):
+        """NumPy random generator used for all random decisions in the landscape (`obj`).
+
+        An unseeded generator is created on first use if none was given."""
+        if self._rng is None:
+            self._rng = np.random.default_rng()
+        return self._rng
+
+    @rng.setter
+    def rng(self, value):
+        self._rng = value
+
+    @property
+    def columns(self):
+        """Column storage for each species (`dict` of :py:class:`.SpeciesColumns`, read-only).
+
+        Missing columns are created, unless the landscape is water."""
+        if len(self._columns) < len(self._species_classes) and self.landscape_type != 'W':
+            for species in self._species_classes:
+                self._species_columns(species)
+        return self._columns
+
+    def _species_columns(self, species):
+        """Return the columns of a species, created if missing.
+
+        Columns are kept in the order of :py:attr:`._species_classes`, so herbivores are
+        always handled before carnivores.
+
+        Parameters
+        ----------
+        species: {'Herbivore', 'Carnivore'}
+            Name of the species.
+
+        Returns
+        -------
+        `obj`
+            :py:class:`.SpeciesColumns` of the species.
+        """
+        if species not in self._columns:
+            self._columns[species] = SpeciesColumns(self._species_classes[species])
+            self._columns = {name: self._columns[name] for name in self._species_classes
+                             if name in self._columns}
+        return self._columns[species]
+
+    @property
+    def population(self):
+        """Views of all animals in current landscape, herbivores before carnivores
+        (:py:class:`.PopulationList`).
+
+        Changes to the list, e.g. appending or removing animals, change the columns.
+        Assigning a list of animals or views replaces the stored population."""
+        return PopulationList(self)
+
+    @population.setter
+    def population(self, value):
+        for species in self._species_classes:
+            self._assign_species(species,
+                                 [animal for animal in value if animal.species == species])
+
+    def _add_to_population(self, animals):
+        """Append animals to the columns of their species, see :py:class:`.PopulationList`.
+
+        Parameters
+        ----------
+        animals: `list` of `obj`
+            Animal objects or views.
+        """
+        for species in self._species_classes:
+            added = [animal for animal in animals if animal.species == species]
+            if added:
+                self._species_columns(species).extend(
+                    [animal.age for animal in added], [animal.weight for animal in added],
+                    [animal.F_tilde for animal in added], [animal.fitness for animal in added])
+
+    @property
+    def herbivores(self):
+        """Views of all herbivores in current landscape (`list`).
+
+        Assigning a list of herbivores or views replaces the stored herbivores."""
+        return self.species_population('Herbivore')
+
+    @herbivores.setter
+    def herbivores(self, value):
+        self._assign_species('Herbivore', value)
+
+    @property
+    def carnivores(self):
+        """Views of all carnivores in current landscape (`list`).
+
+        Assigning a list of carnivores or views replaces the stored carnivores."""
+        return self.species_population('Carnivore')
+
+    @carnivores.setter
+    def carnivores(self, value):
+        self._assign_species('Carnivore', value)
+
+    @property
+    def herbivores_number(self):
+        """The number of herbivores in current landscape (`int`, read-only)."""
+        return self.species_number('Herbivore')
+
+    @property
+    def carnivores_number(self):
+        """The number of carnivores in current landscape (`int`, read-only)."""
+        return self.species_number('Carnivore')
+
+    def species_population(self, species):
+        """Views of all animals of the given species in current landscape.
+
+        Parameters
+        ----------
+        species: {'Herbivore', 'Carnivore'}
+            Name of the species.
+
+        Returns
+        -------
+        `list`
+            Views of the species, see :py:attr:`.herbivores`.
+        """
+        columns = self._columns.get(species)
+        return [] if columns is None else columns.views()
+
+    def species_number(self, species):
+        """The number of animals of the given species in current landscape.
+
+        See Also
+        --------
+        :py:meth:`.Landscape.species_number`
+        """
+        columns = self._columns.get(species)
+        return 0 if columns is None else len(columns)
+
+    def _assign_species(self, species, animals):
+        """Replace all animals of the given species in current landscape.
+
+        Parameters
+        ----------
+        species: {'Herbivore', 'Carnivore'}
+            Name of the species.
+        animals: `list`
+            Animals or views of the species.
+        """
+        if animals or species in self._columns:
+            self._species_columns(species).assign(animals)
+
+    def species_properties(self, species, out):
+        """Copy age, weight and fitness columns of a species into an array.
+
+        See Also
+        --------
+        :py:meth:`.Landscape.species_properties`
+        """
+        columns = self._columns.get(species)
+        if columns is not None:
+            out[:, 0] = columns.age
+            out[:, 1] = columns.weight
+            out[:, 2] = columns.fitness
+
+    def grassing(self):
+        """Feed all herbivores and adjust available fodder.
+
+        See Also
+        --------
+        :py:meth:`.SpeciesColumns.grassing`
+        """
+        if 'Herbivore' in self._columns:
+            index = self._fodder_index
+            self._fodder_array[index] -= self._columns['Herbivore'].grassing(
+                self._fodder_array[index])
+
+    def _fitness_of(self, herbivores):
+        """Return the fitness of all herbivores, read from the columns (`ndarray`)."""
+        columns = self._columns.get('Herbivore')
+        return np.zeros(0) if columns is None else columns.fitness.copy()
+
+    def _graze(self, herbivores, eating_order):
+        """Let herbivores graze in the given order.
+
+        See Also
+        --------
+        :py:meth:`.SpeciesColumns.grassing`
+        """
+        index = self._fodder_index
+        self._fodder_array[index] -= self._columns['Herbivore'].grassing(
+            self._fodder_array[index], eating_order)
+        return self._columns['Herbivore'].fitness.copy()
+
+    def aging(self):
+        """Age all animals by one year.
+
+        See Also
+        --------
+        :py:meth:`.SpeciesColumns.aging`
+        """
+        for columns in self._columns.values():
+            columns.aging()
+
+    def give_birth(self):
+        """Let all animals give birth, one batched step per species.
+
+        Herbivores give birth before carnivores.
+
+        See Also
+        --------
+        :py:meth:`.SpeciesColumns.give_birth`
+        """
+        for columns in self._columns.values():
+            columns.give_birth(self.rng)
+
+    def do_death(self):
+        """Remove dying animals, one vectorized step per species.
+
+        See Also
+        --------
+        :py:meth:`.SpeciesColumns.do_death`
+        """
+        for columns in self._columns.values():
+            columns.do_death(self._uniforms(len(columns)))
+
+    def end_of_year(self):
+        """Give birth, age and remove dying animals, one fused step per species.
+
+        Herbivores are handled before carnivores.
+
+        See Also
+        --------
+        :py:meth:`.SpeciesColumns.end_of_year`
+        """
+        for columns in self._columns.values():
+            columns.end_of_year(self.rng)
+
+    def add_animals(self, added_pop):
+        """Add animals to current location.
+
+        Parameters
+        ----------
+        added_pop: `list` of `dict`
+            Added population of chosen species in current location.
+
+        See Also
+        --------
+        :py:meth:`.Landscape.add_animals`
+        """
+        if self.landscape_type == 'W':
+            raise ValueError('Can not add animals into a water landscape.')
+        added = {species: [] for species in self._species_classes}
+        for animal in added_pop:
+            age = animal['age']
+            weight = animal['weight']
+
+            if animal['species'] == 'Herbivore':
+                added['Herbivore'].append(Herbivore(weight, age))
+            elif animal['species'] == 'Carnivore':
+                added['Carnivore'].append(Carnivore(weight, age))
+            else:
+                raise ValueError(f'{animal} is not a defined animal.\n'
+                                 f'Defined animals are: '
+                                 f'{[cls.__name__ for cls in Animal.__subclasses__()]}')
+
+        for species, animals in added.items():
+            if animals:
+                self._species_columns(species).extend(
+                    [animal.age for animal in animals], [animal.weight for animal in animals],
+                    fitness=[animal.fitness for animal in animals])
+
+    def memory_usage(self):
+        """Estimate memory used by the landscape and its animals.
+
+        Returns
+        -------
+        cell_bytes: `int`
+            Bytes used by the landscape independently of the number of animals.
+        animal_bytes: `int`
+            Bytes used by the animals' columns.
+        """
+        cell_bytes = sys.getsizeof(self) + sys.getsizeof(vars(self)) + sys.getsizeof(self._columns)
+        animal_bytes = 0
+        for columns in self._columns.values():
+            overhead_bytes, columns_bytes = columns.memory_usage()
+            cell_bytes += overhead_bytes
+            animal_bytes += columns_bytes
+
+        return cell_bytes, animal_bytes
+
+    def emigrate(self, masks):
+        """Remove migrating animals and return their attributes.
+
+        Parameters
+        ----------
+        masks: `dict` of `ndarray`
+            Boolean row mask of emigrants for each species.
+
+        Returns
+        -------
+        `dict` of `tuple`
+            Attributes of the emigrants per species, see :py:meth:`.SpeciesColumns.take`.
+        """
+        emigrants = {}
+        for species, mask in masks.items():
+            columns = self._species_columns(species)
+            emigrants[species] = columns.take(mask)
+            columns.compress(~mask)
+        return emigrants
+
+    def immigrate(self, species, attributes):
+        """Add migrating animals of one species.
+
+        Parameters
+        ----------
+        species: {'Herbivore', 'Carnivore'}
+            Species of the immigrants.
+        attributes: `tuple` of `ndarray`
+            Attributes of the immigrants, see :py:meth:`.SpeciesColumns.take`.
+        """
+        self._species_columns(species).extend(*attributes)
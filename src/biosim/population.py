@@ -0,0 +1,568 @@
+"""Implement columnar population storage used by :py:class:`.ColumnarLandscape`,
+and the island-wide layout used by the 'csr' backend of :py:class:`.Island`."""
+
+import sys
+
+import numpy as np
+
+from biosim.animals import Herbivore, Carnivore
+
+
+class AnimalView:
+    """Thin view of a single animal stored in :py:class:`.SpeciesColumns`.
+
+    Notes
+    -----
+    The view provides the same API as :py:class:`.Animal`, but all attributes are read from
+    and written to the column arrays of its species. Concrete views are
+    :py:class:`.HerbivoreView` and :py:class:`.CarnivoreView`.
+
+    A view refers to a row number, and is therefore only valid until the population
+    it belongs to is restructured (animals added, removed or reordered).
+
+    Parameters
+    ----------
+    columns: `obj`
+        :py:class:`.SpeciesColumns` holding the animal.
+    index: `int`
+        Row of the animal in the column arrays.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, columns, index):
+        self._columns = columns
+        self._index = index
+
+    @property
+    def age(self):
+        """The animal's age (`float`)."""
+        return self._columns.age[self._index]
+
+    @age.setter
+    def age(self, value):
+        self._columns.age[self._index] = value
+        self._columns.fitness[self._index] = self._calculate_fitness()
+
+    @property
+    def weight(self):
+        """The animal's weight (`float`)."""
+        return self._columns.weight[self._index]
+
+    @weight.setter
+    def weight(self, value):
+        self._columns.weight[self._index] = value
+        self._columns.fitness[self._index] = self._calculate_fitness()
+
+    @property
+    def F_tilde(self):
+        """Food currently eaten this year by the animal (`float`)."""
+        return self._columns.F_tilde[self._index]
+
+    @F_tilde.setter
+    def F_tilde(self, value):
+        self._columns.F_tilde[self._index] = value
+
+    @property
+    def fitness(self):
+        """The animal's fitness (`float`, read-only)."""
+        return self._columns.fitness[self._index]
+
+
+class HerbivoreView(AnimalView, Herbivore):
+    """View of a herbivore stored in :py:class:`.SpeciesColumns`."""
+
+    __slots__ = ('_columns', '_index')
+
+
+class CarnivoreView(AnimalView, Carnivore):
+    """View of a carnivore stored in :py:class:`.SpeciesColumns`."""
+
+    __slots__ = ('_columns', '_index')
+
+
+class SpeciesColumns:
+    """Population of one species in one cell, stored as contiguous arrays.
+
+    Notes
+    -----
+    Age, weight, fitness and :math:`\\tilde{F}` are kept in one `float` array each,
+    where row *i* of every array describes the same animal. Empty columns all share
+    one empty array, which is replaced as soon as animals are added.
+
+    Parameters
+    ----------
+    species: `class`
+        :py:class:`.Herbivore` or :py:class:`.Carnivore`.
+    """
+
+    _view_classes = {'Herbivore': HerbivoreView, 'Carnivore': CarnivoreView}
+    _empty = np.zeros(0)
+
+    def __init__(self, species):
+        self._species = species
+        self._view_class = self._view_classes[species.species]
+        self.age = self._empty
+        self.weight = self._empty
+        self.F_tilde = self._empty
+        self._fitness = self._empty
+        self._fitness_version = species._params_version
+
+    def __len__(self):
+        return self.age.size
+
+    @property
+    def species(self):
+        """Animal subclass stored in the columns (`class`, read-only)."""
+        return self._species
+
+    @property
+    def fitness(self):
+        """Fitness of all animals (`ndarray`).
+
+        Recalculated if the species' parameters have changed since last calculation."""
+        if self._fitness_version != self._species._params_version:
+            self.update_fitness()
+        return self._fitness
+
+    @fitness.setter
+    def fitness(self, value):
+        self._fitness = value
+
+    def views(self):
+        """Views of all animals in row order (`list` of :py:class:`.AnimalView`)."""
+        return [self._view_class(self, index) for index in range(len(self))]
+
+    def extend(self, age, weight, F_tilde=None, fitness=None):
+        """Append animals to the columns.
+
+        Parameters
+        ----------
+        age: array_like
+            Ages of the added animals.
+        weight: array_like
+            Weights of the added animals.
+        F_tilde: array_like, optional
+            Food eaten this year by the added animals, zero if not given.
+        fitness: array_like, optional
+            Fitness of the added animals, calculated if not given.
+        """
+        age = np.asarray(age, dtype=float)
+        weight = np.asarray(weight, dtype=float)
+        if F_tilde is None:
+            F_tilde = np.zeros(age.size)
+        if fitness is None:
+            fitness = self._species.batch_fitness(age, weight)
+
+        self.fitness = np.concatenate((self.fitness, np.asarray(fitness, dtype=float)))
+        self.age = np.concatenate((self.age, age))
+        self.weight = np.concatenate((self.weight, weight))
+        self.F_tilde = np.concatenate((self.F_tilde, np.asarray(F_tilde, dtype=float)))
+
+    def replace(self, age, weight, F_tilde, fitness):
+        """Replace all columns.
+
+        Parameters
+        ----------
+        age: `ndarray`
+            Ages of the new animals.
+        weight: `ndarray`
+            Weights of the new animals.
+        F_tilde: `ndarray`
+            Food eaten this year by the new animals.
+        fitness: `ndarray`
+            Fitness of the new animals.
+        """
+        self.fitness = fitness
+        self.age = age
+        self.weight = weight
+        self.F_tilde = F_tilde
+
+    def update_fitness(self):
+        """Recalculate the fitness of all animals in one call.
+
+        See Also
+        --------
+        :py:meth:`.Animal.batch_fitness`
+        """
+        fitness = self._species.batch_fitness(self.age, self.weight)
+        if self._fitness.shape == fitness.shape:
+            # Written in place, so columns viewing a SpeciesLayout keep it up to date
+            self._fitness[...] = fitness
+        else:
+            self._fitness = fitness
+        self._fitness_version = self._species._params_version
+
+    def aging(self):
+        """Age all animals by one year and lose weight.
+
+        See Also
+        --------
+        :py:meth:`.Animal.age_and_weightloss`
+        """
+        self.age += 1
+        self.weight -= self.weight * self._species.params['eta']
+        self.update_fitness()
+
+    def grassing(self, fodder, eating_order=None):
+        """Feed all animals in order of fitness from the available fodder.
+
+        Notes
+        -----
+        Animals eat in order of descending fitness, as in :py:meth:`.Landscape.grassing`.
+        The order is found with one stable argsort, and every animal's intake follows
+        from the cumulative appetite of the animals before it, clipped at the available
+        fodder. Weights and fitness are then updated for all animals at once.
+
+        Parameters
+        ----------
+        fodder: `int` or `float`
+            Fodder available.
+        eating_order: `ndarray` of `int`, optional
+            Rows by descending fitness, sorted here if not given.
+
+        Returns
+        -------
+        `float`
+            Fodder eaten in total.
+
+        See Also
+        --------
+        :py:meth:`.Animal.batch_intake`
+        """
+        if eating_order is None:
+            eating_order = np.argsort(-self.fitness, kind='stable')
+        intake = self._species.batch_intake(fodder, len(self))
+
+        self.F_tilde[eating_order] = intake
+        self.weight[eating_order] += intake * self._species.params['beta']
+        self.update_fitness()
+
+        return float(intake.sum())
+
+    def do_death(self, r):
+        """Remove dying animals.
+
+        Notes
+        -----
+        Vectorized version of :py:meth:`.Animal.dies`: an animal dies from starvation if its
+        weight is zero, or from sickness if r is below :math:`\\omega(1-\\Phi)`.
+        Survivors are kept with one boolean mask.
+
+        Parameters
+        ----------
+        r: `ndarray`
+            One uniform random number in [0, 1) per animal.
+
+        Returns
+        -------
+        `int`
+            Number of animals that died.
+        """
+        starvation = self.weight <= 0
+        sickness = r < self._species.params['omega'] * (1 - self.fitness)
+        survivors = ~(starvation | sickness)
+        self.compress(survivors)
+
+        return survivors.size - np.count_nonzero(survivors)
+
+    def give_birth(self, rng):
+        """Let all animals give birth in one batched step.
+
+        Notes
+        -----
+        Vectorized version of :py:meth:`.Animal.probability_to_give_birth` and
+        :py:meth:`.Animal.giving_birth`. Match probabilities, puberty and maternal health are
+        evaluated as arrays, and newborns are appended to the columns in one step.
+
+        Random numbers are drawn in the order: one uniform number per animal deciding
+        fertilization, then one birth weight per fertilized animal that has reached puberty.
+        Nothing is drawn if there are fewer than two animals.
+
+        Parameters
+        ----------
+        rng: `obj`
+            NumPy random generator.
+
+        Returns
+        -------
+        `int`
+            Number of newborns.
+        """
+        mothers, birth_weight = self._births(rng)
+
+        if mothers.size:
+            self.fitness[mothers] = self._species.batch_fitness(self.age[mothers],
+                                                                self.weight[mothers])
+            self.extend(np.zeros(mothers.size), birth_weight)
+
+        return mothers.size
+
+    def _births(self, rng):
+        """Decide which animals give birth, and let the mothers lose weight.
+
+        Fitness of the mothers is not updated. See :py:meth:`.give_birth` for the order
+        of random numbers.
+
+        Parameters
+        ----------
+        rng: `obj`
+            NumPy random generator.
+
+        Returns
+        -------
+        mothers: `ndarray` of `int`
+            Rows of the animals giving birth.
+        birth_weight: `ndarray`
+            Weight of each newborn.
+        """
+        num_animals = len(self)
+        if num_animals < 2:
+            return np.zeros(0, dtype=np.intp), np.zeros(0)
+
+        params = self._species.params
+        match_probability = np.minimum(1, params['gamma'] * self.fitness * (num_animals - 1))
+        fertilization = rng.random(num_animals) < match_probability
+        reached_puberty = self.weight > params['zeta'] * (params['w_birth'] + params['sigma_birth'])
+        candidates = np.flatnonzero(fertilization & reached_puberty)
+
+        birth_weight = rng.normal(params['w_birth'], params['sigma_birth'], candidates.size)
+        maternal_health = self.weight[candidates] > birth_weight * params['xi']
+        births = maternal_health & (birth_weight > 0)
+        mothers = candidates[births]
+        birth_weight = birth_weight[births]
+        self.weight[mothers] -= birth_weight * params['xi']
+
+        return mothers, birth_weight
+
+    def end_of_year(self, rng):
+        """Give birth, age and remove dying animals in one fused step.
+
+        Notes
+        -----
+        Follows the same rules as :py:meth:`.give_birth`, :py:meth:`.aging` and
+        :py:meth:`.do_death` called one after another, but the columns are rebuilt once
+        and fitness is calculated once, after aging.
+
+        Random numbers are drawn in the order of :py:meth:`.give_birth`, followed by
+        one uniform number per animal, newborns included, deciding death.
+
+        Parameters
+        ----------
+        rng: `obj`
+            NumPy random generator.
+
+        Returns
+        -------
+        num_newborns: `int`
+            Number of newborns.
+        num_deaths: `int`
+            Number of animals that died, newborns included.
+        """
+        mothers, birth_weight = self._births(rng)
+        params = self._species.params
+
+        age = np.concatenate((self.age, np.zeros(mothers.size))) + 1
+        weight = np.concatenate((self.weight, birth_weight))
+        weight -= weight * params['eta']
+        F_tilde = np.concatenate((self.F_tilde, np.zeros(mothers.size)))
+        fitness = self._species.batch_fitness(age, weight)
+
+        sickness = rng.random(age.size) < params['omega'] * (1 - fitness)
+        survivors = ~((weight <= 0) | sickness)
+        self.replace(age[survivors], weight[survivors], F_tilde[survivors], fitness[survivors])
+        self._fitness_version = self._species._params_version
+
+        return mothers.size, survivors.size - np.count_nonzero(survivors)
+
+    def take(self, mask):
+        """Copy out the rows selected by mask.
+
+        Parameters
+        ----------
+        mask: `ndarray` of `bool`
+            True for every row to copy.
+
+        Returns
+        -------
+        `tuple` of `ndarray`
+            Age, weight, F_tilde and fitness of the selected rows,
+            in the order accepted by :py:meth:`.extend`.
+        """
+        return self.age[mask], self.weight[mask], self.F_tilde[mask], self.fitness[mask]
+
+    def compress(self, mask):
+        """Keep only the rows selected by mask.
+
+        Parameters
+        ----------
+        mask: `ndarray` of `bool`
+            True for every row to keep.
+        """
+        self.fitness = self.fitness[mask]
+        self.age = self.age[mask]
+        self.weight = self.weight[mask]
+        self.F_tilde = self.F_tilde[mask]
+
+    def memory_usage(self):
+        """Estimate memory used by the columns.
+
+        Returns
+        -------
+        overhead_bytes: `int`
+            Bytes used independently of the number of animals.
+        animal_bytes: `int`
+            Bytes used by the animals' attributes.
+        """
+        arrays = (self.age, self.weight, self.F_tilde, self._fitness)
+        animal_bytes = sum(array.nbytes for array in arrays)
+        overhead_bytes = sys.getsizeof(self) + sys.getsizeof(vars(self))
+        for array in arrays:
+            if array is not self._empty:
+                overhead_bytes += sys.getsizeof(array)
+                overhead_bytes -= array.nbytes if array.flags.owndata else 0
+
+        return overhead_bytes, animal_bytes
+
+    def assign(self, animals):
+        """Replace the columns with the attributes of the given animals.
+
+        All attributes are copied before the columns are replaced,
+        so the animals may be views of these columns.
+
+        Parameters
+        ----------
+        animals: `list` of `obj`
+            Animal objects or views of the stored species.
+        """
+        columns = (np.array([animal.age for animal in animals], dtype=float),
+                   np.array([animal.weight for animal in animals], dtype=float),
+                   np.array([animal.F_tilde for animal in animals], dtype=float),
+                   np.array([animal.fitness for animal in animals], dtype=float))
+        self.age, self.weight, self.F_tilde, self.fitness = columns
+
+
+class SpeciesLayout:
+    """Population of one species on the whole island, stored as global arrays sorted by cell.
+
+    Notes
+    -----
+    Age, weight, :math:`\\tilde{F}` and fitness of all animals are kept in one array each,
+    grouped by cell in row order. The animals of cell *i* are the rows
+    offsets[i] to offsets[i + 1], as in the compressed sparse row (CSR) format.
+
+    The per-cell :py:class:`.SpeciesColumns` are bound to views of these arrays by
+    :py:meth:`.scatter`, so phases updating animals in place work on contiguous slices.
+    Phases adding or removing animals give the cell new arrays, and the layout is then
+    rebuilt with :py:meth:`.gather`.
+
+    Parameters
+    ----------
+    species: `class`
+        :py:class:`.Herbivore` or :py:class:`.Carnivore`.
+    num_cells: `int`
+        Number of cells on the island.
+    """
+
+    _attributes = ('age', 'weight', 'F_tilde', 'fitness')
+
+    def __init__(self, species, num_cells):
+        self._species = species
+        self.age = np.zeros(0)
+        self.weight = np.zeros(0)
+        self.F_tilde = np.zeros(0)
+        self.fitness = np.zeros(0)
+        self.offsets = np.zeros(num_cells + 1, dtype=np.intp)
+
+    def __len__(self):
+        return self.age.size
+
+    @property
+    def species(self):
+        """Animal subclass stored in the layout (`class`, read-only)."""
+        return self._species
+
+    def cell_sizes(self):
+        """Number of animals in every cell (`ndarray` of `int`)."""
+        return np.diff(self.offsets)
+
+    def cells(self):
+        """Cell of every animal (`ndarray` of `int`)."""
+        return np.repeat(np.arange(self.offsets.size - 1), self.cell_sizes())
+
+    def gather(self, cells, columns):
+        """Rebuild the layout from per-cell columns.
+
+        Parameters
+        ----------
+        cells: `ndarray` of `int`
+            Indices of all cells holding animals of the species, in ascending order.
+        columns: `list` of :py:class:`.SpeciesColumns`
+            Columns of the species in these cells.
+        """
+        sizes = np.zeros(self.offsets.size - 1, dtype=np.intp)
+        sizes[cells] = [len(species_columns) for species_columns in columns]
+        self.offsets[1:] = np.cumsum(sizes)
+
+        for name in self._attributes:
+            arrays = [getattr(species_columns, name) for species_columns in columns]
+            setattr(self, name, np.concatenate(arrays) if arrays else np.zeros(0))
+
+    def regroup(self, destinations):
+        """Move animals to new cells, keeping the layout sorted by cell.
+
+        Parameters
+        ----------
+        destinations: `ndarray` of `int`
+            New cell of every animal.
+        """
+        order, counts = self.counting_sort(destinations, self.offsets.size - 1)
+        self.offsets[1:] = np.cumsum(counts)
+        for name in self._attributes:
+            setattr(self, name, getattr(self, name)[order])
+
+    def scatter(self, cells, columns):
+        """Bind per-cell columns to views of the layout.
+
+        Parameters
+        ----------
+        cells: `ndarray` of `int`
+            Indices of the cells to bind.
+        columns: `list` of :py:class:`.SpeciesColumns`
+            Columns of the species in these cells.
+        """
+        for cell, species_columns in zip(cells, columns):
+            rows = slice(self.offsets[cell], self.offsets[cell + 1])
+            species_columns.replace(*(getattr(self, name)[rows] for name in self._attributes))
+
+    @staticmethod
+    def counting_sort(keys, num_keys):
+        """Group keys with a stable sort in linear time.
+
+        Notes
+        -----
+        Keys fitting into 16 bits are sorted by NumPy's radix sort on `uint16`.
+        Larger keys are sorted in two stable passes, low 16 bits first.
+
+        Parameters
+        ----------
+        keys: `ndarray` of `int`
+            Keys in [0, num_keys).
+        num_keys: `int`
+            Number of possible keys.
+
+        Returns
+        -------
+        order: `ndarray` of `int`
+            Indices sorting keys, equal keys kept in their original order.
+        counts: `ndarray` of `int`
+            Number of occurrences of every key.
+        """
+        counts = np.bincount(keys, minlength=num_keys)
+        if num_keys <= 1 << 16:
+            order = np.argsort(keys.astype(np.uint16), kind='stable')
+        else:
+            order = np.argsort((keys & 0xFFFF).astype(np.uint16), kind='stable')
+            order = order[np.argsort((keys[order] >> 16).astype(np.uint16), kind='stable')]
+
+        return order, counts
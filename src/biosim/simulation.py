@@ -5,7 +5,6 @@
 # (C) Copyright 2021 Hans Ekkehard Plesser / NMBU
 
 import numpy as np
-import random
 import os
 from dataclasses import dataclass
 from biosim.animals import Herbivore, Carnivore
@@ -34,7 +33,7 @@ class BioSim(BioSimParam):
         ini_pop: `list` of `dict`, optional
             Population to be placed on island, see Notes.
         seed: `int`, optional
-            Random seed
+            Random seed for the simulation's own NumPy random generator
         vis_years: `int`, optional
             Years between visualization updates (if 0, disable graphics)
         ymax_animals: `int` or `float`, optional
@@ -53,6 +52,10 @@ class BioSim(BioSimParam):
             Years between visualizations saved to files (default: vis_years)
         log_file: `str`, optional
             See Notes
+        backend: {'object', 'columnar', 'csr'}, optional
+            Population storage, see Notes
+        engine: `dict`, optional
+            Engine options, see Notes
 
         Attributes
         ----------
@@ -71,16 +74,20 @@ class BioSim(BioSimParam):
             Default image format, 'png'.
         population_map_herbivore: `ndarray`
             Array containing herbivore population for each cell.
+            Updated in place only in years where graphics are shown or saved.
         population_map_carnivore: `ndarray`
             Array containing carnivore population for each cell.
+            Updated in place only in years where graphics are shown or saved.
         population_size_herbivore: `list`
             List containig total herbivore population size for every simulated year.
         population_size_carnivore: `list`
             List containig total carnivore population size for every simulated year.
-        herbivore_age_weight_fitness: `ndarray`
-            Array containing information about every herbivore's age, weight and fitness.
-        carnivore_age_weight_fitness: `ndarray`
-            Array containing information about every carnivore's age, weight and fitness.
+        herbivore_histogram_counts: `dict` of `ndarray`
+            Number of herbivores in every age, weight and fitness histogram bin.
+            Updated only in years where graphics are shown or saved.
+        carnivore_histogram_counts: `dict` of `ndarray`
+            Number of carnivores in every age, weight and fitness histogram bin.
+            Updated only in years where graphics are shown or saved.
 
         Notes
         -----
@@ -116,22 +123,60 @@ class BioSim(BioSimParam):
 
         :math:`\mathtt{log\_file}` is created under the biosim repository whether input
         is given or not. Input has no affection to this.
+
+        :math:`\\mathtt{backend}` selects how animals are stored. 'object' keeps one
+        :py:class:`.Animal` object per animal in :py:class:`.Landscape`, while 'columnar'
+        keeps NumPy arrays per species in :py:class:`.ColumnarLandscape`, using far less memory
+        for large populations. 'csr' stores animals like 'columnar', and additionally keeps
+        each species in island-wide arrays sorted by cell, see :py:class:`.SpeciesLayout`.
+        The layout is rebuilt after migration and after the end-of-year phases.
+        All backends follow the same rules, so results can be compared.
+
+        :math:`\\mathtt{engine}` selects optional engine modes. Given options replace
+        the defaults
+            >>> {'migration': 'cellwise', 'end_of_year': 'separate', 'feeding': 'separate'}
+        'migration' is passed on to :py:class:`.Island`. 'vectorized' migration decides
+        migration for all animals at once and requires the 'columnar' or 'csr' backend.
+        'end_of_year' set to 'fused' replaces birth, aging and death by one pass per cell,
+        see :py:meth:`.Landscape.end_of_year`. It follows the same rules, but draws random
+        numbers in a different order, documented there.
+        'feeding' set to 'fused' replaces grassing and hunting by one pass per cell sharing
+        one fitness ordering, see :py:meth:`.Landscape.feeding`, where its equivalence
+        to the separate phases is documented.
         """
 
+    _default_engine = {'migration': 'cellwise', 'end_of_year': 'separate',
+                       'feeding': 'separate'}
+    _engine_choices = {'migration': ('cellwise', 'vectorized'),
+                       'end_of_year': ('separate', 'fused'),
+                       'feeding': ('separate', 'fused')}
+
+    # Column of each property in :py:meth:`.Island.species_properties`
+    _property_columns = {'age': 0, 'weight': 1, 'fitness': 2}
+
     def __init__(self, island_map, ini_pop=None, seed=None,
                  vis_years=1, ymax_animals=None, cmax_animals=None, hist_specs=None,
                  img_dir=None, img_base=None, img_fmt='png', img_years=None,
-                 log_file=None):
-        random.seed(seed)
+                 log_file=None, backend='object', engine=None):
+        self._rng = np.random.default_rng(seed)
+
+        if engine is None:
+            engine = {}
+        for option, value in engine.items():
+            if option not in self._default_engine:
+                raise KeyError(f'{option} is not a defined engine option. '
+                               f'Defined engine options are: {list(self._default_engine)}')
+            if value not in self._engine_choices[option]:
+                raise ValueError(f'{value} is not a defined value of engine option {option}. '
+                                 f'Defined values are: {list(self._engine_choices[option])}')
+        self._engine = {**self._default_engine, **engine}
 
         # Create island object
         if self._validate_island_map(island_map):
-            self.island = Island(island_map)
+            self.island = Island(island_map, backend, self._rng, self._engine['migration'])
 
         # Initial property values
         self._year = 0
-        self._num_animals_per_species = {'Herbivore': 0, 'Carnivore': 0}
-        self._num_animals = 0
 
         # Add population
         self.add_population(ini_pop)
@@ -141,12 +186,13 @@ class BioSim(BioSimParam):
         self._num_years = 0
 
         # Generate data
-        self.population_map_herbivore = np.empty(())
-        self.population_map_carnivore = np.empty(())
+        self.population_map_herbivore = np.zeros(self.island.base_map.shape)
+        self.population_map_carnivore = np.zeros(self.island.base_map.shape)
         self.population_size_herbivore = []
         self.population_size_carnivore = []
-        self.herbivore_age_weight_fitness = []
-        self.carnivore_age_weight_fitness = []
+        self.herbivore_histogram_counts = {}
+        self.carnivore_histogram_counts = {}
+        self._properties_buffers = {'Herbivore': np.empty((0, 3)), 'Carnivore': np.empty((0, 3))}
 
         # Control graphics
         self._img_dir = img_dir
@@ -377,6 +423,11 @@ class BioSim(BioSimParam):
 
         return True
 
+    @property
+    def engine(self):
+        """Engine options in use (`dict`, read-only)."""
+        return dict(self._engine)
+
     @property
     def year(self):
         """Last year simulated (`int`)."""
@@ -385,12 +436,22 @@ class BioSim(BioSimParam):
     @property
     def num_animals(self):
         """Total number of animals on island (`int`)."""
-        return self._num_animals
+        return self.island.num_animals
 
     @property
     def num_animals_per_species(self):
         """Number of animals per species on island (`dict`)."""
-        return self._num_animals_per_species
+        return self.island.num_animals_per_species
+
+    @property
+    def skipped_hunting_attempts(self):
+        """Hunting attempts saved by early exit on the whole island (`int`, read-only).
+
+        See Also
+        --------
+        :py:meth:`.Carnivore.hunt`
+        """
+        return sum(landscape.skipped_attempts for landscape in self.island.object_map.flat)
 
     def set_animal_parameters(self, species, params):
         """Set parameters for animal species.
@@ -491,26 +552,49 @@ class BioSim(BioSimParam):
                             'For more information see documentation.')
         if population:
             self.island.add_population_in_location(population)
-            num_animals, num_herbivores, num_carnivores = 0, 0, 0
-
-            for dictionary in population:
-                num_animals += len(dictionary['pop'])
-
-                for animal in dictionary['pop']:
-                    if animal['species'] == 'Herbivore':
-                        num_herbivores += 1
-                    if animal['species'] == 'Carnivore':
-                        num_carnivores += 1
-
-            self._num_animals += num_animals
-            self._num_animals_per_species['Herbivore'] += num_herbivores
-            self._num_animals_per_species['Carnivore'] += num_carnivores
         else:
             return None
 
         msg = f'add_population {population}'
         logger.info(msg)
 
+    def memory_report(self):
+        """Estimate memory used by the island's cells and animals.
+
+        Notes
+        -----
+        Bytes per cell covers every cell of the island, including water, and excludes animals.
+        Bytes per animal covers the animal storage of the chosen backend.
+        An estimate for a larger job is thus
+        :math:`\\mathtt{cells * bytes\\_per\\_cell + animals * bytes\\_per\\_animal}`.
+
+        Returns
+        -------
+        `dict`
+            Keys 'backend', 'num_cells', 'num_animals', 'bytes_per_cell',
+            'bytes_per_animal' and 'total_bytes'.
+        """
+        cell_bytes, animal_bytes = 0, 0
+        num_animals = 0
+        for landscape in self.island.object_map.flat:
+            landscape_cell_bytes, landscape_animal_bytes = landscape.memory_usage()
+            cell_bytes += landscape_cell_bytes
+            animal_bytes += landscape_animal_bytes
+            num_animals += landscape.herbivores_number + landscape.carnivores_number
+
+        num_cells = self.island.object_map.size
+        report = {'backend': self.island.backend,
+                  'num_cells': num_cells,
+                  'num_animals': num_animals,
+                  'bytes_per_cell': cell_bytes / num_cells,
+                  'bytes_per_animal': animal_bytes / num_animals if num_animals else 0,
+                  'total_bytes': cell_bytes + animal_bytes}
+
+        msg = f'memory_report {report}'
+        logger.info(msg)
+
+        return report
+
     def make_movie(self):
         """Create MPEG4 movie from visualizing images saved.
 
@@ -532,9 +616,13 @@ class BioSim(BioSimParam):
         Notes
         -----
         The simulation takes all animals trough the :py:meth:`._annual_cycle`,
-        gathers data using :py:meth:`_collect_annual_data`, and sends requested data
+        counts the animals using :py:meth:`_count_annual_data`, and sends requested data
         to the :py:class:`.Graphics` module, performed by method :py:meth:`_do_annual_graphics`.
 
+        Heatmap and histogram data are only gathered by :py:meth:`_collect_annual_data`
+        in years where graphics are shown or saved. With ``vis_years=0`` and no
+        ``img_dir`` the simulation thus runs headless, keeping only the population counts.
+
         Parameters
         ----------
         num_years: `int`
@@ -562,91 +650,137 @@ class BioSim(BioSimParam):
             msg = f'Annual cycle for {current_year} completed'
             logger.info(msg)
 
-            self._collect_annual_data()
-            msg = f'Collection of annual data for {current_year} completed '
+            self._count_annual_data()
+            num_animals_per_species = self.num_animals_per_species
+            msg = f'Counting of annual data for {current_year} completed '
             logger.info(msg)
 
             self._do_annual_graphics(current_year)
             msg = f'Production of annual graphics for {current_year} completed'
             logger.info(msg)
 
-            self._num_animals_per_species = {'Herbivore': self.population_map_herbivore.sum(),
-                                             'Carnivore': self.population_map_carnivore.sum()}
-            self._num_animals = self.population_map_herbivore.sum() + \
-                                self.population_map_carnivore.sum()
-
             msg = f'Completed year:{current_year} ' \
-                  f'Herbivores:{self.population_map_herbivore.sum()}   ' \
-                  f'Carnivores:{self.population_map_carnivore.sum()}'
+                  f'Herbivores:{num_animals_per_species["Herbivore"]}   ' \
+                  f'Carnivores:{num_animals_per_species["Carnivore"]}'
             logger.info(msg)
 
             print('\r',
-                  f'Year:{current_year}  Herbivores:{self.population_map_herbivore.sum()}   '
-                  f'Carnivores:{self.population_map_carnivore.sum()}',
+                  f'Year:{current_year}  Herbivores:{num_animals_per_species["Herbivore"]}   '
+                  f'Carnivores:{num_animals_per_species["Carnivore"]}',
                   end='')
 
         print()
 
     def _annual_cycle(self):
-        """Simulate one cycle of evolution on the island."""
-        with np.nditer(self.island.object_map, flags=['multi_index', 'refs_ok']) as it:
-            for element in it:
-                landscape = element.item()
-                if landscape.landscape_type in 'LH':
-                    landscape.regrowth()
-                    landscape.grassing()
-                if landscape.landscape_type in 'LHD':
-                    landscape.hunting()
+        """Simulate one cycle of evolution on the island.
+
+        Fodder regrows on the whole island at once, while the other phases
+        only visit cells holding animals."""
+        self.island.regrowth()
+
+        if self._engine['feeding'] == 'fused':
+            for landscape in self.island.occupied_landscapes():
+                landscape.feeding(regrow=False)
+        else:
+            for landscape in self.island.occupied_landscapes('LH'):
+                landscape.grassing()
+
+            for landscape in self.island.occupied_landscapes():
+                landscape.hunting()
 
         self.island.do_migration()
 
-        with np.nditer(self.island.object_map, flags=['multi_index', 'refs_ok']) as it:
-            for element in it:
-                landscape = element.item()
-                if landscape.landscape_type in 'LHD':
-                    landscape.give_birth()
-                    landscape.aging()
-                    landscape.do_death()
+        if self._engine['end_of_year'] == 'fused':
+            for landscape in self.island.occupied_landscapes():
+                landscape.end_of_year()
+        else:
+            for landscape in self.island.occupied_landscapes():
+                landscape.give_birth()
+                landscape.aging()
+                landscape.do_death()
+
+        self.island.update_occupied()
+        if self.island.layouts:
+            self.island.rebuild_layout()
+
+    def _count_annual_data(self):
+        """Append the island's population counts after each year simulated.
+
+        The counts are kept up to date by :py:class:`.Island`, so no cell is visited.
+        """
+        num_animals_per_species = self.island.num_animals_per_species
+        self.population_size_herbivore.append(num_animals_per_species['Herbivore'])
+        self.population_size_carnivore.append(num_animals_per_species['Carnivore'])
 
     def _collect_annual_data(self):
-        """Generate data for each year simulated.
+        """Generate data for heatmaps and histograms.
 
-        Generate data for heatmaps, population size and histograms.
+        Only called in years where graphics are shown or saved.
         """
         # Generate data for heatmaps
-        self.population_map_herbivore = self.island.get_property_map('v_size_herb_pop')
-        self.population_map_carnivore = self.island.get_property_map('v_size_carn_pop')
-
-        # Generate data for population size
-        self.population_size_herbivore.append(self.population_map_herbivore.sum())
-        self.population_size_carnivore.append(self.population_map_carnivore.sum())
+        self.island.density_map('Herbivore', out=self.population_map_herbivore)
+        self.island.density_map('Carnivore', out=self.population_map_carnivore)
 
         # Generate data for histograms
-        herbivore_object_map = self.island.get_property_map_objects('v_herb_properties_objects')
-        carnivore_object_map = self.island.get_property_map_objects('v_carn_properties_objects')
-
-        object_maps = [herbivore_object_map, carnivore_object_map]
-        for species in object_maps:
-            acc_list = []
-            with np.nditer(species, flags=['multi_index', 'refs_ok']) as it:
-                for element in it:
-                    list_on_location = element.item()
-                    if list_on_location:
-                        acc_list += list_on_location
-
-            if species is herbivore_object_map:
-                self.herbivore_age_weight_fitness = np.asarray(acc_list)
-            if species is carnivore_object_map:
-                self.carnivore_age_weight_fitness = np.asarray(acc_list)
+        self.herbivore_histogram_counts = self._histogram_counts('Herbivore')
+        self.carnivore_histogram_counts = self._histogram_counts('Carnivore')
 
-    def _do_annual_graphics(self, current_year):
-        """Decide how the current year's graphics shall be provided,
-        and send data to :py:class:`.Graphics`.
+    def _histogram_counts(self, species):
+        """Count a species' animals in the histogram bins of :py:class:`.Graphics`.
+
+        Parameters
+        ----------
+        species: {'Herbivore', 'Carnivore'}
+            Species to count.
+
+        Returns
+        -------
+        `dict` of `ndarray`
+            Number of animals in every bin of :py:attr:`.Graphics.histogram_edges`,
+            for 'age', 'weight' and 'fitness'.
+        """
+        properties = self.island.species_properties(species, self._properties_buffer(species))
+        return {key: np.histogram(properties[:, self._property_columns[key]], bins=edges)[0]
+                for key, edges in self.graphics.histogram_edges.items()}
+
+    def _properties_buffer(self, species):
+        """Return a buffer for :py:meth:`.Island.species_properties`, reused between years.
+
+        The buffer at least doubles when it is too small for the species' animals.
+
+        Parameters
+        ----------
+        species: {'Herbivore', 'Carnivore'}
+            Species to collect.
+
+        Returns
+        -------
+        `ndarray`
+            Array of shape (at least number of animals, 3).
+        """
+        num_animals = self.island.num_animals_per_species[species]
+        buffer = self._properties_buffers[species]
+        if buffer.shape[0] < num_animals:
+            buffer = np.empty((max(num_animals, 2 * buffer.shape[0]), 3))
+            self._properties_buffers[species] = buffer
+        return buffer
+
+    def _graphics_request(self, current_year):
+        """Decide how the current year's graphics shall be provided.
 
         Parameters
         ----------
         current_year: `int`
             Current year being simulated
+
+        Returns
+        -------
+        show: `bool`
+            True if the graphics are shown this year.
+        save: `bool`
+            True if the graphics are saved to file this year.
+        pause: `float`
+            Pause after updating the graphics.
         """
         pause = 0.2
         show = False
@@ -672,11 +806,27 @@ class BioSim(BioSimParam):
             if current_year % self._img_years == 0:
                 save = True
 
+        return show, save, pause
+
+    def _do_annual_graphics(self, current_year):
+        """Send data to :py:class:`.Graphics` if the current year's graphics are requested.
+
+        Heatmap and histogram data are collected by :py:meth:`_collect_annual_data`
+        only in those years.
+
+        Parameters
+        ----------
+        current_year: `int`
+            Current year being simulated
+        """
+        show, save, pause = self._graphics_request(current_year)
+
         if any((show, save)):
+            self._collect_annual_data()
             self.graphics.show_grid(self.population_map_herbivore,
                                     self.population_map_carnivore,
                                     np.asarray(self.population_size_herbivore),
                                     np.asarray(self.population_size_carnivore),
-                                    self.herbivore_age_weight_fitness,
-                                    self.carnivore_age_weight_fitness,
+                                    self.herbivore_histogram_counts,
+                                    self.carnivore_histogram_counts,
                                     pause, current_year, show, save)
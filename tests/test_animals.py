@@ -1,5 +1,6 @@
 """Tests for animal class, concerning both herbivores and carnivores."""
 import pytest
+import numpy as np
 from random import gauss, seed
 from statsmodels.stats.weightstats import ztest
 from scipy.stats import binom_test
@@ -122,6 +123,57 @@ def test_fitness_parameter_change(species):
     assert species(12.5, 10).fitness == 1/4
 
 
+@pytest.mark.parametrize('species', [Herbivore, Carnivore])
+def test_animal_slots(species):
+    """Test that animals use a slotted layout without instance dictionary."""
+    assert not hasattr(species(12.5, 10), '__dict__')
+
+
+@pytest.mark.parametrize('species', [Herbivore, Carnivore])
+def test_fitness_lazy(mocker, species):
+    """Test that fitness is calculated once per read after a mutation, not once per write."""
+    spy = mocker.spy(species, '_calculate_fitness')
+    animal = species(12.5, 10)
+    animal.age_and_weightloss()
+    animal.eat(5)
+    first_read = animal.fitness
+    second_read = animal.fitness
+
+    assert all([spy.call_count == 1, first_read == second_read])
+
+
+@pytest.mark.parametrize('species', [Herbivore, Carnivore])
+def test_fitness_invalidated_by_set_params(species):
+    """Test that set_params invalidates the cached fitness of existing animals."""
+    animal = species(12.5, 10)
+    initial_fitness = animal.fitness
+    species.set_params({'phi_age': 0, 'phi_weight': 0})
+    assert all([initial_fitness != 1/4, animal.fitness == 1/4])
+
+
+@pytest.mark.parametrize('species', [Herbivore, Carnivore])
+def test_batch_fitness(species):
+    """Test that batched fitness equals the fitness of single animals, including zero weight."""
+    ages = [0, 10, 40, 80]
+    weights = [0, 12.5, 4, 50]
+    fitness = species.batch_fitness(ages, weights)
+
+    for age, weight, batch_value in zip(ages, weights, fitness):
+        assert batch_value == pytest.approx(species(weight, age).fitness, abs=1e-15)
+
+
+def test_batch_intake():
+    """Test that batched intake equals eating one after another until the fodder is gone."""
+    fodder = 25
+    expected = []
+    for _ in range(4):
+        eaten = Herbivore(20, 5).eat(fodder)
+        expected.append(eaten)
+        fodder -= eaten
+
+    assert list(Herbivore.batch_intake(25, 4)) == expected
+
+
 @pytest.mark.parametrize('species', [Herbivore, Carnivore])
 def test_eat_unlimited(species):
     """Test correct weight gain when the amount of food available
@@ -405,6 +457,30 @@ def test_death_probability_survive(mocker, species):
     assert not healthy_animal.dies()
 
 
+@pytest.mark.parametrize('species', [Herbivore, Carnivore])
+def test_given_random_numbers(species):
+    """Deterministic test: Decisions use the given random numbers instead of drawing their own."""
+    animal = species(12.5, 10)
+    assert all([animal.dies(r=0), not animal.dies(r=1),
+                animal.probability_to_migrate(r=0), not animal.probability_to_migrate(r=1)])
+
+
+def test_given_birth_weight():
+    """Deterministic test: A given birth weight is used for the newborn."""
+    Herbivore.set_params({'xi': 0, 'zeta': 0, 'gamma': 0.5})
+    mother = Herbivore(Herbivore.params['w_half'], Herbivore.params['a_half'])
+    assert mother.probability_to_give_birth(10, r=0, birth_weight=7.5) == 7.5
+
+
+@pytest.mark.parametrize('species', [Herbivore, Carnivore])
+def test_birth_weight_drawn_only_if_fertile(mocker, species):
+    """Test that no birth weight is drawn if fertilization fails."""
+    mocked_gauss = mocker.patch('biosim.animals.gauss', return_value=7)
+    animal = species(species.params['w_half'], species.params['a_half'])
+    animal.probability_to_give_birth(10, r=1)
+    assert not mocked_gauss.called
+
+
 def test_hungry():
     """Test that carnivore is hungry by default."""
     carn = Carnivore(12.5, 10)
@@ -477,3 +553,33 @@ def test_killing_no_prob():
     than the carnivore's fitness."""
     carn = Carnivore(12.5, 10)
     assert not carn.killing(herb_fitness=carn.fitness * 2, herb_weight=10)
+
+
+def test_killing_probability_no_draw_for_fitter_herbivore(mocker):
+    """Test that no random number is drawn when the herbivore is fitter than the carnivore."""
+    mocked_uniform = mocker.patch('biosim.animals.uniform', return_value=0)
+    carn = Carnivore(12.5, 10)
+    carn.probability_to_kill(carn.fitness * 2)
+    assert not mocked_uniform.called
+
+
+def test_hunt_stops_when_sated(mocker):
+    """Test that the carnivore stops hunting once it has eaten F, and only tries
+    herbivores until it is sated."""
+    mocked_uniform = mocker.patch('biosim.animals.uniform', return_value=0)
+    carn = Carnivore(40, 5)
+    alive = np.ones(4, dtype=bool)
+    num_kills, num_attempts = carn.hunt(np.zeros(4), np.full(4, 30.0), alive)
+
+    assert all([num_kills == 2, num_attempts == 2, mocked_uniform.call_count == 2,
+                list(alive) == [False, False, True, True]])
+
+
+def test_hunt_skips_fitter_prey():
+    """Test that herbivores at or above the carnivore's fitness are never attempted."""
+    carn = Carnivore(12.5, 10)
+    prey_fitness = np.array([carn.fitness, 1, 1])
+    num_kills, num_attempts = carn.hunt(prey_fitness, np.full(3, 10.0), np.ones(3, dtype=bool),
+                                        np.random.default_rng(1))
+
+    assert (num_kills, num_attempts) == (0, 0)
@@ -235,3 +235,225 @@ def test_no_migration(mocker, geogr_str):
 
     assert all([island.object_map[1, 1].population,
                 not island.object_map[1, 2].population])
+
+
+@pytest.mark.parametrize('backend', ['object', 'columnar'])
+def test_cell_added_directly_needs_update(geogr_str, backend):
+    """Test that a cell populated through its own methods is occupied after update_occupied."""
+    island = Island(geogr_str, backend)
+    island.object_map[1, 1].add_animals([{'species': 'Herbivore', 'age': 5, 'weight': 20}])
+    cells_before = list(island.occupied_cells())
+    island.update_occupied(np.array([5]))
+
+    assert all([cells_before == [], list(island.occupied_cells()) == [5],
+                island.num_animals == 1])
+
+
+def test_invalid_backend(geogr_str):
+    """Test that ValueError rises if an undefined population backend is given."""
+    with pytest.raises(ValueError):
+        Island(geogr_str, backend='dataframe')
+
+
+def test_columnar_migration(mocker, geogr_str):
+    """Test migration of animals between columnar landscapes."""
+    mocker.patch('biosim.animals.uniform', return_value=0)
+    mocker.patch('biosim.island.choice', return_value='E')
+    island = Island(geogr_str, backend='columnar')
+    add_pop = [{'loc': (2, 2), 'pop': [{'species': 'Herbivore', 'age': 6, 'weight': 6.5},
+                                       {'species': 'Carnivore', 'age': 6, 'weight': 6.5}]}]
+    island.add_population_in_location(add_pop)
+    island.do_migration()
+
+    assert all([not island.object_map[1, 1].population,
+                island.object_map[1, 2].herbivores_number == 1,
+                island.object_map[1, 2].carnivores_number == 1,
+                island.object_map[1, 2].herbivores[0].weight == 6.5])
+
+
+@pytest.mark.parametrize('backend', ['object', 'columnar'])
+def test_fodder_map(geogr_str, backend):
+    """Test that the island's fodder array follows grassing, regrowth and f_max changes."""
+    island = Island(geogr_str, backend)
+    island.add_population_in_location([{'loc': (2, 2), 'pop': [{'species': 'Herbivore',
+                                                                'age': 5, 'weight': 20}]}])
+    island.object_map[1, 1].grassing()
+    grassed_fodder = island.fodder_map[1, 1]
+    Landscape.set_params({'f_max': {'Lowland': 500.0}})
+    island.regrowth()
+    regrown_fodder = island.fodder_map.copy()
+    Landscape.set_params(Landscape._default_params)
+
+    assert all([grassed_fodder == 800 - Herbivore.params['F'],
+                list(regrown_fodder.flat) == [0, 0, 0, 0, 0, 500, 300, 0, 0, 0, 0, 0],
+                island.object_map[1, 1].fodder == 500])
+
+
+@pytest.mark.parametrize('backend', ['object', 'columnar'])
+def test_occupied_cells(mocker, geogr_str, backend):
+    """Test that occupied cells follow adding, migration and emptied cells."""
+    mocker.patch('biosim.animals.uniform', return_value=0)
+    mocker.patch('biosim.island.choice', return_value='E')
+
+    island = Island(geogr_str, backend)
+    add_pop = [{'loc': (2, 2), 'pop': [{'species': 'Herbivore', 'age': 6, 'weight': 6.5}]}]
+    island.add_population_in_location(add_pop)
+    added_cells = list(island.occupied_cells())
+    island.do_migration()
+    migrated_cells = list(island.occupied_cells())
+    island.object_map[1, 2].population = []
+    island.update_occupied()
+
+    assert all([added_cells == [5], migrated_cells == [6],
+                not island.occupied_map.any()])
+
+
+def test_migration_buffered(mocker):
+    """Test that all animals of a crowded cell move exactly one cell, keeping their species."""
+    mocker.patch('biosim.animals.uniform', return_value=0)
+    mocker.patch('biosim.island.choice', return_value='E')
+
+    island = Island(textwrap.dedent("""\
+                                       WWWWW
+                                       WLLLW
+                                       WWWWW"""))
+    add_pop = [{'loc': (2, 2), 'pop': [{'species': species, 'age': 6, 'weight': 6.5}
+                                       for species in ['Herbivore'] * 60 + ['Carnivore'] * 40]}]
+    island.add_population_in_location(add_pop)
+    island.do_migration()
+
+    assert all([island.object_map[1, 1].herbivores_number == 0,
+                island.object_map[1, 2].herbivores_number == 60,
+                island.object_map[1, 2].carnivores_number == 40,
+                not island.object_map[1, 3].population])
+
+
+def test_neighbours(geogr_str):
+    """Test that the neighbour table points to land neighbours, and to the cell itself
+    where the neighbour is water."""
+    island = Island(geogr_str)
+    assert all([list(island.neighbours[5]) == [5, 5, 6, 5],
+                list(island.neighbours[6]) == [6, 6, 6, 5],
+                island.neighbours.shape == (12, 4)])
+
+
+def test_vectorized_migration_requires_columnar(geogr_str):
+    """Test that ValueError rises for an undefined migration engine, or for vectorized
+    migration with the object backend."""
+    with pytest.raises(ValueError):
+        Island(geogr_str, migration='teleport')
+    with pytest.raises(ValueError):
+        Island(geogr_str, backend='object', migration='vectorized')
+
+
+def test_vectorized_migration():
+    """Test that vectorized migration moves animals with probability one to a land
+    neighbour, keeping their attributes."""
+    Herbivore.set_params({'mu': 1 / 0.7})
+    geogr = textwrap.dedent("""\
+                               WWWWW
+                               WWLWW
+                               WLLLW
+                               WWLWW
+                               WWWWW""")
+    island = Island(geogr, 'columnar', np.random.default_rng(1), 'vectorized')
+    add_pop = [{'loc': (3, 3), 'pop': [{'species': 'Herbivore', 'age': 6, 'weight': 40}
+                                       for _ in range(200)]}]
+    island.add_population_in_location(add_pop)
+    island.do_migration()
+    Herbivore.set_params(Herbivore._default_params)
+
+    counts = island.get_property_map('v_size_herb_pop')
+    assert all([counts[2, 2] == 0, counts.sum() == 200,
+                list(island.occupied_cells()) == [7, 11, 13, 17],
+                all(animal.weight == 40 for animal in island.object_map[1, 2].herbivores)])
+
+
+def test_land_cells():
+    """Test that land cells are grouped by landscape type, also among occupied cells."""
+    island = Island(textwrap.dedent("""\
+                                       WWWWW
+                                       WLHDW
+                                       WWWWW"""))
+    island.add_population_in_location([{'loc': (2, loc),
+                                        'pop': [{'species': 'Herbivore', 'age': 5, 'weight': 20}]}
+                                       for loc in (2, 4)])
+
+    assert all([list(island.land_cells('L')) == [6],
+                list(island.land_cells()) == [6, 7, 8],
+                list(island.occupied_cells('LH')) == [6],
+                [landscape.landscape_type for landscape in island.occupied_landscapes('D')] ==
+                ['D']])
+
+
+@pytest.mark.parametrize('backend, migration', [('object', 'cellwise'),
+                                                ('columnar', 'cellwise'),
+                                                ('csr', 'vectorized')])
+def test_counts_follow_population(geogr_str, backend, migration):
+    """Test that the island's counts match its cells after adding, hunting,
+    migration, births and deaths."""
+    island = Island(geogr_str, backend, np.random.default_rng(3), migration)
+    island.add_population_in_location(
+        [{'loc': (2, 2), 'pop': [{'species': species, 'age': 5, 'weight': 30}
+                                 for species in ['Herbivore'] * 40 + ['Carnivore'] * 10]}])
+    added = island.num_animals_per_species
+    for _ in range(3):
+        for landscape in island.occupied_landscapes():
+            landscape.hunting()
+        island.do_migration()
+        for landscape in island.occupied_landscapes():
+            landscape.end_of_year()
+        island.update_occupied()
+
+    herbivores = [landscape.herbivores_number for landscape in island.object_map.flat]
+    carnivores = [landscape.carnivores_number for landscape in island.object_map.flat]
+    assert all([added == {'Herbivore': 40, 'Carnivore': 10},
+                list(island.count_map('Herbivore').flat) == herbivores,
+                list(island.count_map('Carnivore').flat) == carnivores,
+                island.num_animals == sum(herbivores) + sum(carnivores),
+                list(island.occupied_map.flat) == [h + c > 0
+                                                   for h, c in zip(herbivores, carnivores)]])
+
+
+@pytest.mark.parametrize('backend', ['object', 'columnar', 'csr'])
+def test_species_properties(geogr_str, backend):
+    """Test that species_properties returns every animal's age, weight and fitness cell by cell,
+    writing into a preallocated buffer, and that density_map matches the counts."""
+    island = Island(geogr_str, backend)
+    island.add_population_in_location(
+        [{'loc': (2, 3), 'pop': [{'species': 'Herbivore', 'age': 3, 'weight': 20}]},
+         {'loc': (2, 2), 'pop': [{'species': 'Herbivore', 'age': 6, 'weight': 6.5},
+                                 {'species': 'Carnivore', 'age': 1, 'weight': 8}]}])
+    buffer = np.zeros((4, 3))
+    properties = island.species_properties('Herbivore', buffer)
+    density = island.density_map('Herbivore', np.empty(island.base_map.shape))
+
+    assert all([properties.base is buffer,
+                properties.tolist() == [[6, 6.5, Herbivore(6.5, 6).fitness],
+                                        [3, 20, Herbivore(20, 3).fitness]],
+                density[1, 1] == 1, density[1, 2] == 1, density.sum() == 2])
+
+
+@pytest.mark.parametrize('backend', ['object', 'columnar'])
+def test_property_maps_follow_changed_cell(geogr_str, backend):
+    """Test that the property maps follow a cell changed through its own methods."""
+    island = Island(geogr_str, backend, np.random.default_rng(1))
+    island.add_population_in_location(
+        [{'loc': (2, 2), 'pop': [{'species': 'Herbivore', 'age': 5, 'weight': 20}] * 20 +
+                                [{'species': 'Carnivore', 'age': 5, 'weight': 50}] * 5}])
+    island.object_map[1, 1].hunting()
+    num_herbivores = island.object_map[1, 1].herbivores_number
+    size_map = island.get_property_map('v_size_herb_pop')
+    properties_map = island.get_property_map_objects('v_herb_properties_objects')
+
+    assert all([num_herbivores < 20, size_map[1, 1] == num_herbivores,
+                len(properties_map[1, 1]) == num_herbivores])
+
+
+def test_species_properties_buffer_too_small(geogr_str):
+    """Test that ValueError rises if the buffer holds fewer rows than animals."""
+    island = Island(geogr_str)
+    island.add_population_in_location(
+        [{'loc': (2, 2), 'pop': [{'species': 'Herbivore', 'age': 6, 'weight': 6.5}] * 2}])
+    with pytest.raises(ValueError):
+        island.species_properties('Herbivore', np.empty((1, 3)))
@@ -1,6 +1,10 @@
+from copy import deepcopy
 import pytest
+import numpy as np
 from biosim.animals import Herbivore, Carnivore
-from biosim.landscape import Landscape
+from biosim.landscape import Landscape, ColumnarLandscape
+
+SEED = 12345678  # random seed for tests
 
 
 @pytest.fixture(autouse=True)
@@ -106,7 +110,8 @@ def test_set_population(terrain):
                   Herbivore(9, 25)]
     location_cell = Landscape(terrain)
     location_cell.population = population
-    assert location_cell.population == population
+    herbivores_first = [population[0], population[3], population[1], population[2]]
+    assert location_cell.population == herbivores_first
 
 
 @pytest.mark.parametrize('terrain', ['L', 'H', 'D'])
@@ -219,6 +224,18 @@ def test_hunting_no_killing(terrain):
     assert len(preys) == len(location_cell.herbivores)
 
 
+def test_hunting_skipped_attempts():
+    """Test that sated carnivores skip all their attempts, and that skips are accumulated."""
+    Carnivore.set_params({'F': 0})
+    location_cell = Landscape('L')
+    location_cell.population += [Herbivore(10, 5) for _ in range(3)] + \
+                                [Carnivore(30, 5) for _ in range(2)]
+    location_cell.hunting()
+    location_cell.hunting()
+
+    assert location_cell.skipped_attempts == 12
+
+
 @pytest.mark.parametrize('terrain', ['L', 'H', 'D'])
 def test_hunting_only_killing(terrain):
     """Test for no herbivore population if all are killed during hunt."""
@@ -234,6 +251,35 @@ def test_hunting_only_killing(terrain):
     assert not location_cell.herbivores
 
 
+def test_hunting_matches_sequential_killing():
+    """Test that hunting gives the same survivors and carnivore weights as letting every
+    carnivore call killing on every living herbivore in order, when every kill of a weaker
+    herbivore is certain."""
+    Carnivore.set_params({'DeltaPhiMax': 1e-9})
+    added_pop = ([{'species': 'Herbivore', 'age': age % 30, 'weight': 5 + age % 17}
+                  for age in range(300)] +
+                 [{'species': 'Carnivore', 'age': age % 10, 'weight': 20 + age % 13}
+                  for age in range(80)])
+    landscape_cell = Landscape('L', rng=np.random.default_rng(SEED))
+    landscape_cell.add_animals(added_pop)
+    reference_cell = deepcopy(landscape_cell)
+    landscape_cell.hunting()
+
+    carnivores = reference_cell.carnivores
+    hunting_order = [carnivores[index]
+                     for index in reference_cell.rng.permutation(len(carnivores))]
+    prey_order = sorted(reference_cell.herbivores, key=lambda x: x.fitness)
+    for hunter in hunting_order:
+        hunter.F_tilde = 0
+        prey_order = [prey for prey in prey_order
+                      if not hunter.killing(prey.fitness, prey.weight, 0.5)]
+
+    assert all([[prey.weight for prey in landscape_cell.herbivores] ==
+                [prey.weight for prey in prey_order],
+                [hunter.weight for hunter in landscape_cell.carnivores] ==
+                [hunter.weight for hunter in hunting_order]])
+
+
 @pytest.mark.parametrize('terrain', ['L', 'H', 'D'])
 def test_all_giving_birth(mocker, terrain):
     """Test correct update of population if all animals give birth."""
@@ -370,3 +416,189 @@ def test_add_animal_water():
     landscape_cell = Landscape('W')
     with pytest.raises(ValueError):
         landscape_cell.add_animals(added_pop)
+
+
+@pytest.mark.parametrize('terrain', ['L', 'H', 'D'])
+def test_columnar_add_animals(terrain):
+    """Test that animals added to a columnar landscape are stored per species."""
+    added_pop = [{'species': 'Herbivore', 'age': 10, 'weight': 12.5},
+                 {'species': 'Carnivore', 'age': 10, 'weight': 12.5},
+                 {'species': 'Herbivore', 'age': 20, 'weight': 11}]
+
+    landscape_cell = ColumnarLandscape(terrain)
+    landscape_cell.add_animals(added_pop)
+
+    assert all([len(landscape_cell.population) == 3,
+                landscape_cell.herbivores_number == 2,
+                landscape_cell.carnivores_number == 1,
+                list(landscape_cell.columns['Herbivore'].age) == [10, 20]])
+
+
+def test_columnar_storage_created_on_first_add():
+    """Test that a columnar landscape creates columns and a generator only when needed."""
+    landscape_cell = ColumnarLandscape('L')
+    empty_state = (dict(landscape_cell._columns), landscape_cell._rng,
+                   landscape_cell.herbivores_number, landscape_cell.population)
+    landscape_cell.add_animals([{'species': 'Carnivore', 'age': 10, 'weight': 12.5}])
+    landscape_cell.add_animals([{'species': 'Herbivore', 'age': 10, 'weight': 12.5}])
+    landscape_cell.end_of_year()
+
+    assert all([empty_state == ({}, None, 0, []),
+                list(landscape_cell._columns) == ['Herbivore', 'Carnivore'],
+                landscape_cell._rng is not None,
+                not ColumnarLandscape('W').columns])
+
+
+def test_columnar_add_invalid_animal():
+    """Test that ValueError rises when invalid animal is added to a columnar landscape."""
+    landscape_cell = ColumnarLandscape('L')
+    with pytest.raises(ValueError):
+        landscape_cell.add_animals([{'species': 'Penguin', 'age': 10, 'weight': 12.5}])
+
+
+def test_columnar_grassing_matches_object():
+    """Test that grassing gives the same weights for both population backends."""
+    herbivores = [{'species': 'Herbivore', 'age': age, 'weight': 10 + age} for age in range(100)]
+    object_cell = Landscape('H')
+    columnar_cell = ColumnarLandscape('H')
+    for landscape_cell in (object_cell, columnar_cell):
+        landscape_cell.add_animals(herbivores)
+        landscape_cell.grassing()
+
+    assert all([columnar_cell.fodder == object_cell.fodder,
+                sorted(animal.weight for animal in columnar_cell.herbivores) ==
+                sorted(animal.weight for animal in object_cell.herbivores)])
+
+
+def test_random_generator_reproducible():
+    """Test that landscapes with equally seeded generators give equal populations."""
+    added_pop = [{'species': species, 'age': 5, 'weight': 30}
+                 for species in ['Herbivore'] * 50 + ['Carnivore'] * 10]
+    populations = []
+    for _ in range(2):
+        landscape_cell = Landscape('L', rng=np.random.default_rng(SEED))
+        landscape_cell.add_animals(added_pop)
+        landscape_cell.grassing()
+        landscape_cell.hunting()
+        landscape_cell.give_birth()
+        landscape_cell.aging()
+        landscape_cell.do_death()
+        populations.append(sorted((animal.species, animal.weight)
+                                  for animal in landscape_cell.population))
+
+    assert populations[0] == populations[1]
+
+
+@pytest.mark.parametrize('landscape_class', [Landscape, ColumnarLandscape])
+def test_species_population(landscape_class):
+    """Test that species containers and counts follow added and removed animals."""
+    landscape_cell = landscape_class('L')
+    landscape_cell.add_animals([{'species': 'Herbivore', 'age': 5, 'weight': 20}] * 3 +
+                               [{'species': 'Carnivore', 'age': 5, 'weight': 20}] * 2)
+    landscape_cell.herbivores = landscape_cell.herbivores[1:]
+
+    assert all([landscape_cell.herbivores_number == 2,
+                landscape_cell.carnivores_number == 2,
+                len(landscape_cell.species_population('Herbivore')) == 2,
+                len(landscape_cell.population) == 4])
+
+
+def test_f_max_follows_set_params():
+    """Test that the cached f_max is invalidated by set_params, also for existing landscapes."""
+    landscape_cells = [Landscape('L'), ColumnarLandscape('L')]
+    Landscape.set_params({'f_max': {'Lowland': 500.0}})
+    for landscape_cell in landscape_cells:
+        landscape_cell.regrowth()
+
+    assert all(landscape_cell.f_max == landscape_cell.fodder == 500.0
+               for landscape_cell in landscape_cells)
+
+
+def test_end_of_year_matches_separate_phases(mocker):
+    """Deterministic test: The fused end-of-year pass gives the same animals as birth,
+    aging and death called one after another."""
+    mocker.patch('biosim.animals.uniform', return_value=0)
+    mocker.patch('biosim.animals.gauss', return_value=Herbivore.params['w_birth'])
+    Herbivore.set_params({'omega': 0})
+    Carnivore.set_params({'omega': 0})
+    added_pop = [{'species': species, 'age': 5, 'weight': 30 + 5 * index}
+                 for index, species in enumerate(['Herbivore'] * 8 + ['Carnivore'] * 4)]
+    separate_cell, fused_cell = Landscape('L'), Landscape('L')
+    for landscape_cell in (separate_cell, fused_cell):
+        landscape_cell.add_animals(added_pop)
+    separate_cell.give_birth()
+    separate_cell.aging()
+    separate_cell.do_death()
+    fused_cell.end_of_year()
+    separate_animals, fused_animals = [sorted((animal.species, animal.age, animal.weight)
+                                              for animal in landscape_cell.population)
+                                       for landscape_cell in (separate_cell, fused_cell)]
+
+    assert all([fused_animals == separate_animals, len(fused_animals) > len(added_pop)])
+
+
+@pytest.mark.parametrize('landscape_class', [Landscape, ColumnarLandscape])
+def test_feeding_matches_separate_phases(landscape_class):
+    """Test that fused feeding gives the same animals and fodder as grassing followed by
+    hunting, using equally seeded generators and herbivores of distinct fitness."""
+    added_pop = ([{'species': 'Herbivore', 'age': index % 20, 'weight': 5 + 0.37 * index}
+                  for index in range(120)] +
+                 [{'species': 'Carnivore', 'age': index % 7, 'weight': 25 + 0.53 * index}
+                  for index in range(30)])
+    separate_cell = landscape_class('L', rng=np.random.default_rng(SEED))
+    separate_cell.add_animals(added_pop)
+    fused_cell = deepcopy(separate_cell)
+    separate_cell.grassing()
+    separate_cell.hunting()
+    fused_cell.feeding()
+
+    assert all([fused_cell.fodder == separate_cell.fodder,
+                sorted((animal.species, animal.weight) for animal in fused_cell.population) ==
+                sorted((animal.species, animal.weight) for animal in separate_cell.population),
+                fused_cell.herbivores_number < len(added_pop) - 30])
+
+
+@pytest.mark.parametrize('landscape_class', [Landscape, ColumnarLandscape])
+def test_population_view_mutation(landscape_class):
+    """Test that changes to the population view change the species' containers."""
+    def described(animals):
+        return [(animal.species, animal.age, animal.weight) for animal in animals]
+
+    herbivore, carnivore, newcomer = Herbivore(10, 5), Carnivore(10, 5), Carnivore(8, 3)
+    location_cell = landscape_class('L')
+    location_cell.population.append(carnivore)
+    population = location_cell.population
+    population.extend([herbivore, Herbivore(12, 2)])
+    population.append(Carnivore(9, 4))
+    location_cell.population[-1] = newcomer
+    appended = described(location_cell.population)
+    del location_cell.population[0]
+
+    assert all([appended == described([herbivore, Herbivore(12, 2), carnivore, newcomer]),
+                described(location_cell.herbivores) == described([Herbivore(12, 2)]),
+                described(location_cell.carnivores) == described([carnivore, newcomer]),
+                len(population) == 4])
+
+
+class NormalRecordingGenerator(np.random.Generator):
+    """Generator recording the number of gaussian numbers drawn per call."""
+
+    def __init__(self, seed):
+        super().__init__(np.random.PCG64(seed))
+        self.normal_sizes = []
+
+    def normal(self, loc, scale, size):
+        self.normal_sizes.append(size)
+        return super().normal(loc, scale, size)
+
+
+@pytest.mark.parametrize('method', ['give_birth', 'end_of_year'])
+def test_birth_weights_drawn_for_candidates(method):
+    """Test that birth weights are only drawn for fertilized animals past puberty."""
+    Herbivore.set_params({'gamma': 1})
+    landscape_cell = Landscape('L', rng=NormalRecordingGenerator(SEED))
+    landscape_cell.add_animals([{'species': 'Herbivore', 'age': 5, 'weight': weight}
+                                for weight in [50] * 4 + [1] * 6])
+    getattr(landscape_cell, method)()
+
+    assert landscape_cell.rng.normal_sizes == [4, 0]
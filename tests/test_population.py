@@ -0,0 +1,228 @@
+"""Tests for columnar population storage."""
+import pytest
+import numpy as np
+
+from biosim.animals import Herbivore, Carnivore
+from biosim.population import SpeciesColumns, SpeciesLayout
+
+
+@pytest.fixture(autouse=True)
+def reset_params_default():
+    """Reset parameters to default after test has run."""
+    yield
+    Herbivore.set_params(Herbivore._default_params)
+    Carnivore.set_params(Carnivore._default_params)
+
+
+@pytest.mark.parametrize('species', [Herbivore, Carnivore])
+def test_extend_fitness(species):
+    """Test that fitness of added animals equals the fitness of animal objects."""
+    columns = SpeciesColumns(species)
+    columns.extend([10, 5], [12.5, 0])
+    assert all([len(columns) == 2,
+                columns.fitness[0] == species(12.5, 10).fitness,
+                columns.fitness[1] == 0])
+
+
+@pytest.mark.parametrize('species', [Herbivore, Carnivore])
+def test_views_species(species):
+    """Test that views are instances of the stored species."""
+    columns = SpeciesColumns(species)
+    columns.extend([10], [12.5])
+    view = columns.views()[0]
+    assert all([isinstance(view, species), view.species == species.species])
+
+
+def test_view_writes_columns():
+    """Test that attribute changes through a view are written to the columns."""
+    columns = SpeciesColumns(Herbivore)
+    columns.extend([10], [12.5])
+    view = columns.views()[0]
+    view.eat(5)
+
+    assert all([columns.weight[0] == 12.5 + 5 * Herbivore.params['beta'],
+                columns.F_tilde[0] == 5,
+                columns.fitness[0] == Herbivore(columns.weight[0], 10).fitness])
+
+
+def test_take_and_compress():
+    """Test that take copies selected rows, and compress keeps selected rows."""
+    columns = SpeciesColumns(Herbivore)
+    columns.extend([1, 2, 3], [10, 20, 30])
+    mask = np.array([True, False, True])
+    age, weight, F_tilde, fitness = columns.take(mask)
+    columns.compress(~mask)
+
+    assert all([list(age) == [1, 3], list(weight) == [10, 30],
+                list(columns.age) == [2], list(columns.weight) == [20]])
+
+
+def test_assign_from_own_views():
+    """Test that the columns can be replaced by a reordered list of their own views."""
+    columns = SpeciesColumns(Carnivore)
+    columns.extend([1, 2, 3], [10, 20, 30])
+    columns.assign(columns.views()[::-1])
+    assert list(columns.age) == [3, 2, 1]
+
+
+@pytest.mark.parametrize('species', [Herbivore, Carnivore])
+def test_aging_columns(species):
+    """Test that aging of columns gives the same result as aging of animal objects."""
+    columns = SpeciesColumns(species)
+    columns.extend([10, 3], [12.5, 30])
+    animals = [species(12.5, 10), species(30, 3)]
+    columns.aging()
+    for animal in animals:
+        animal.age_and_weightloss()
+
+    assert all([list(columns.age) == [animal.age for animal in animals],
+                list(columns.weight) == [animal.weight for animal in animals],
+                columns.fitness == pytest.approx([animal.fitness for animal in animals])])
+
+
+def test_grassing_columns_limited_fodder():
+    """Test that the fittest herbivores eat first, and no more fodder than available is eaten."""
+    columns = SpeciesColumns(Herbivore)
+    columns.extend([80, 5, 40], [10, 30, 20])
+    eaten = columns.grassing(15)
+
+    assert all([eaten == 15,
+                list(columns.F_tilde) == [0, 10, 5]])
+
+
+def test_columns_fitness_invalidated_by_set_params():
+    """Test that set_params invalidates the fitness stored in columns."""
+    columns = SpeciesColumns(Herbivore)
+    columns.extend([10, 3], [12.5, 30])
+    Herbivore.set_params({'phi_age': 0, 'phi_weight': 0})
+    columns.extend([5], [5])
+    assert list(columns.fitness) == [1/4, 1/4, 1/4]
+
+
+@pytest.mark.parametrize('species', [Herbivore, Carnivore])
+def test_death_starvation_and_sickness(species):
+    """Deterministic test: Starved animals die whatever the random number,
+    healthy animals die only if the random number is below omega(1 - fitness)."""
+    columns = SpeciesColumns(species)
+    columns.extend([10, 10, 10], [0, 12.5, 12.5])
+    probability = species.params['omega'] * (1 - columns.fitness[1])
+    num_deaths = columns.do_death(np.array([1, probability * 0.99, probability]))
+
+    assert all([num_deaths == 2, list(columns.weight) == [12.5]])
+
+
+def test_death_matches_dies():
+    """Test that the vectorized death step decides like Animal.dies for the same numbers."""
+    columns = SpeciesColumns(Carnivore)
+    ages = list(range(0, 100, 5))
+    weights = [2.0 * age / 5 for age in ages]
+    columns.extend(ages, weights)
+    draws = np.linspace(0, 1, len(ages))
+    expected = [(age, weight) for age, weight, r in zip(ages, weights, draws)
+                if not Carnivore(weight, age).dies(r)]
+    columns.do_death(draws)
+
+    assert list(zip(columns.age, columns.weight)) == expected
+
+
+class RecordingGenerator:
+    """Generator stand-in returning zeros, and mean birth weights while recording their number."""
+
+    def __init__(self):
+        self.normal_sizes = []
+
+    def random(self, size):
+        return np.zeros(size)
+
+    def normal(self, loc, scale, size):
+        self.normal_sizes.append(size)
+        return np.full(size, loc)
+
+
+@pytest.mark.parametrize('species', [Herbivore, Carnivore])
+def test_give_birth_all(species):
+    """Deterministic test: All animals give birth, and mothers lose xi times the birth weight."""
+    species.set_params({'zeta': 0, 'gamma': 1})
+    columns = SpeciesColumns(species)
+    columns.extend([10] * 5, [40] * 5)
+    num_newborns = columns.give_birth(RecordingGenerator())
+    birth_weight = species.params['w_birth']
+
+    assert all([num_newborns == 5,
+                list(columns.age) == [10] * 5 + [0] * 5,
+                list(columns.weight) == [40 - birth_weight * species.params['xi']] * 5 +
+                [birth_weight] * 5])
+
+
+def test_give_birth_weights_only_for_candidates():
+    """Test that birth weights are only drawn for fertilized animals that reached puberty."""
+    Herbivore.set_params({'gamma': 1})
+    columns = SpeciesColumns(Herbivore)
+    columns.extend([10, 10, 10], [40, 5, 40])
+    rng = RecordingGenerator()
+    columns.give_birth(rng)
+
+    assert all([rng.normal_sizes == [2], len(columns) == 5])
+
+
+def test_give_birth_alone():
+    """Test that a single animal gives no birth and draws no random numbers."""
+    columns = SpeciesColumns(Herbivore)
+    columns.extend([10], [40])
+    rng = RecordingGenerator()
+    assert all([columns.give_birth(rng) == 0, rng.normal_sizes == []])
+
+
+def test_layout_gather_and_scatter():
+    """Test that scattered columns are views of the layout, sorted by cell."""
+    columns = [SpeciesColumns(Herbivore) for _ in range(2)]
+    columns[0].extend([1, 2], [10, 20])
+    columns[1].extend([3], [30])
+    layout = SpeciesLayout(Herbivore, 4)
+    layout.gather(np.array([1, 3]), columns)
+    layout.scatter(np.array([1, 3]), columns)
+    columns[1].aging()
+
+    assert all([list(layout.offsets) == [0, 0, 2, 2, 3],
+                list(layout.cells()) == [1, 1, 3],
+                list(layout.age) == [1, 2, 4],
+                layout.fitness[2] == columns[1].fitness[0]])
+
+
+def test_layout_regroup():
+    """Test that regrouping moves animals to their new cells, keeping their order within cells."""
+    layout = SpeciesLayout(Herbivore, 3)
+    columns = SpeciesColumns(Herbivore)
+    columns.extend([1, 2, 3, 4], [10, 20, 30, 40])
+    layout.gather(np.array([0]), [columns])
+    layout.regroup(np.array([2, 0, 2, 1]))
+
+    assert all([list(layout.cell_sizes()) == [1, 1, 2],
+                list(layout.age) == [2, 4, 1, 3]])
+
+
+@pytest.mark.parametrize('num_keys', [10, 70000])
+def test_counting_sort(num_keys):
+    """Test that the counting sort groups keys stably, for both small and large key ranges."""
+    keys = np.random.default_rng(1).integers(num_keys, size=1000)
+    order, counts = SpeciesLayout.counting_sort(keys, num_keys)
+    assert all([list(order) == list(np.argsort(keys, kind='stable')),
+                list(counts) == list(np.bincount(keys, minlength=num_keys))])
+
+
+def test_end_of_year_matches_separate_phases():
+    """Deterministic test: The fused end-of-year step gives the same columns as birth,
+    aging and death called one after another."""
+    Herbivore.set_params({'gamma': 1, 'omega': 0})
+    separate, fused = SpeciesColumns(Herbivore), SpeciesColumns(Herbivore)
+    for columns in (separate, fused):
+        columns.extend([10, 20, 3, 1], [40, 35, 5, 0])
+    separate.give_birth(RecordingGenerator())
+    separate.aging()
+    separate.do_death(np.ones(len(separate)))
+    num_newborns, num_deaths = fused.end_of_year(RecordingGenerator())
+
+    assert all([(num_newborns, num_deaths) == (2, 1),
+                list(fused.age) == list(separate.age),
+                list(fused.weight) == list(separate.weight),
+                list(fused.fitness) == list(separate.fitness)])
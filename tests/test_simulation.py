@@ -359,3 +359,183 @@ def test_simulation_modulus_error_second_sim(map_str):
     sim.simulate(8)
     with pytest.raises(ValueError):
         sim.simulate(10)
+
+
+def test_backends_deterministic_equal():
+    """Deterministic test: All population backends give identical herbivores when
+    birth, migration and death by sickness are disabled."""
+    Herbivore.set_params({'gamma': 0, 'mu': 0, 'omega': 0})
+    ini_pop = [{'loc': (2, 2), 'pop': [{'species': 'Herbivore', 'age': age, 'weight': 20}
+                                       for age in range(50)]}]
+    island_map = "WWWW\nWLHW\nWWWW"
+    herbivores = []
+    for backend in ['object', 'columnar', 'csr']:
+        sim = BioSim(island_map, ini_pop, seed=1, vis_years=0, backend=backend)
+        sim.simulate(5)
+        herbivores.append(sorted((animal.age, animal.weight)
+                                 for animal in sim.island.object_map[1, 1].herbivores))
+
+    assert herbivores[0] == herbivores[1] == herbivores[2]
+
+
+@pytest.mark.parametrize('backend', ['object', 'columnar', 'csr'])
+def test_memory_report(map_str, backend):
+    """Test that the memory report adds up for both population backends."""
+    ini_pop = [{'loc': (2, 2), 'pop': [{'species': 'Herbivore', 'age': 5, 'weight': 20}
+                                       for _ in range(100)]}]
+    report = BioSim(map_str, ini_pop, backend=backend).memory_report()
+
+    assert all([report['backend'] == backend,
+                report['num_cells'] == 9,
+                report['num_animals'] == 100,
+                report['bytes_per_animal'] > 0,
+                report['total_bytes'] == pytest.approx(9 * report['bytes_per_cell'] +
+                                                       100 * report['bytes_per_animal'])])
+
+
+def test_skipped_hunting_attempts(map_str):
+    """Test that the island's skipped hunting attempts sum the landscapes' counters."""
+    ini_pop = [{'loc': (2, 2), 'pop': [{'species': species, 'age': 5, 'weight': 20}
+                                       for species in ['Herbivore'] * 50 + ['Carnivore'] * 20]}]
+    sim = BioSim(map_str, ini_pop, seed=1, vis_years=0)
+    sim.simulate(2)
+
+    assert sim.skipped_hunting_attempts == sum(landscape.skipped_attempts for landscape
+                                               in sim.island.object_map.flat) > 0
+
+
+def test_invalid_engine_option(map_str):
+    """Test that KeyError rises for an undefined engine option."""
+    with pytest.raises(KeyError):
+        BioSim(map_str, engine={'warp': True})
+
+
+def test_invalid_engine_value(map_str):
+    """Test that ValueError rises for an undefined value of an engine option."""
+    with pytest.raises(ValueError):
+        BioSim(map_str, engine={'end_of_year': 'never'})
+
+
+@pytest.mark.parametrize('backend', ['object', 'columnar'])
+def test_fused_end_of_year_engine(map_str, backend):
+    """Test that the fused end-of-year engine gives newborns and ages the population."""
+    ini_pop = [{'loc': (2, 2), 'pop': [{'species': 'Herbivore', 'age': 5, 'weight': 40}
+                                       for _ in range(50)]}]
+    sim = BioSim(map_str, ini_pop, seed=1, vis_years=0, backend=backend,
+                 engine={'end_of_year': 'fused'})
+    sim.simulate(1)
+    ages = [animal.age for landscape in sim.island.object_map.flat
+            for animal in landscape.herbivores]
+
+    assert all([min(ages) == 1, max(ages) == 6])
+
+
+@pytest.mark.parametrize('backend', ['object', 'columnar'])
+def test_fused_feeding_engine(map_str, backend):
+    """Test that the fused feeding engine lets herbivores graze and carnivores hunt."""
+    ini_pop = [{'loc': (2, 2), 'pop': [{'species': species, 'age': 5, 'weight': 20}
+                                       for species in ['Herbivore'] * 50 + ['Carnivore'] * 20]}]
+    sim = BioSim(map_str, ini_pop, seed=1, vis_years=0, backend=backend,
+                 engine={'feeding': 'fused'})
+    sim.simulate(1)
+
+    assert all([sim.island.fodder_map.sum() < sim.island.f_max_map.sum(),
+                sim.skipped_hunting_attempts > 0])
+
+
+def test_vectorized_migration_engine(map_str):
+    """Test that the vectorized migration engine keeps the number of herbivores
+    when birth and death are disabled."""
+    Herbivore.set_params({'gamma': 0, 'omega': 0})
+    ini_pop = [{'loc': (2, 2), 'pop': [{'species': 'Herbivore', 'age': 5, 'weight': 20}
+                                       for _ in range(100)]}]
+    sim = BioSim(map_str, ini_pop, seed=1, vis_years=0, backend='columnar',
+                 engine={'migration': 'vectorized'})
+    sim.simulate(3)
+
+    assert all([sim.engine['migration'] == 'vectorized', sim.num_animals == 100])
+
+
+def test_csr_layout_follows_simulation(map_str):
+    """Test that the csr backend's layouts hold every animal, sorted by cell, after a year."""
+    ini_pop = [{'loc': (2, 2), 'pop': [{'species': species, 'age': 5, 'weight': 20}
+                                       for species in ['Herbivore'] * 80 + ['Carnivore'] * 10]}]
+    sim = BioSim(map_str, ini_pop, seed=1, vis_years=0, backend='csr',
+                 engine={'migration': 'vectorized'})
+    sim.simulate(2)
+    layout = sim.island.layouts['Herbivore']
+
+    assert all([len(layout) == sim.num_animals_per_species['Herbivore'],
+                list(layout.cell_sizes().reshape(sim.island.base_map.shape).flat) ==
+                list(sim.island.get_property_map('v_size_herb_pop').flat)])
+
+
+def test_memory_report_columnar_smaller(map_str):
+    """Test that the columnar backend uses less memory per animal than the object backend."""
+    ini_pop = [{'loc': (2, 2), 'pop': [{'species': 'Herbivore', 'age': 5, 'weight': 20}
+                                       for _ in range(100)]}]
+    object_report = BioSim(map_str, ini_pop, backend='object').memory_report()
+    columnar_report = BioSim(map_str, ini_pop, backend='columnar').memory_report()
+    assert columnar_report['bytes_per_animal'] < object_report['bytes_per_animal']
+
+
+def test_simulations_independent_streams():
+    """Test that simulations in one process do not share random streams:
+    interleaving two simulations does not change the result of either."""
+    island_map = "WWWW\nWLHW\nWWWW"
+    ini_pop = [{'loc': (2, 2), 'pop': [{'species': 'Herbivore', 'age': 5, 'weight': 20}
+                                       for _ in range(50)]}]
+    alone = BioSim(island_map, ini_pop, seed=1, vis_years=0)
+    alone.simulate(5)
+
+    first = BioSim(island_map, ini_pop, seed=1, vis_years=0)
+    second = BioSim(island_map, ini_pop, seed=2, vis_years=0)
+    for _ in range(5):
+        first.simulate(1)
+        second.simulate(1)
+
+    assert first.population_size_herbivore == alone.population_size_herbivore
+
+
+def test_headless_skips_collection(map_str, mocker):
+    """Test that a headless simulation never collects heatmap and histogram data,
+    while the population counts are still kept for every year."""
+    ini_pop = [{'loc': (2, 2), 'pop': [{'species': 'Herbivore', 'age': 5, 'weight': 20}
+                                       for _ in range(50)]}]
+    sim = BioSim(map_str, ini_pop, seed=1, vis_years=0)
+    mocker.spy(sim, '_collect_annual_data')
+    sim.simulate(5)
+    assert all([sim._collect_annual_data.call_count == 0,
+                len(sim.population_size_herbivore) == 5,
+                sim.num_animals_per_species['Herbivore'] == sim.population_size_herbivore[-1],
+                sim.num_animals == sum(landscape.herbivores_number + landscape.carnivores_number
+                                       for landscape in sim.island.object_map.flat)])
+
+
+def test_histogram_counts(map_str):
+    """Test that collected histogram counts bin every animal with the edges of hist_specs."""
+    ini_pop = [{'loc': (2, 2), 'pop': [{'species': 'Herbivore', 'age': age, 'weight': 20}
+                                       for age in (1, 3, 3, 12, 70)]}]
+    sim = BioSim(map_str, ini_pop, vis_years=0, hist_specs={'age': {'max': 20, 'delta': 5}})
+    sim._collect_annual_data()
+    counts = sim.herbivore_histogram_counts
+    assert all([list(sim.graphics.histogram_edges['age']) == [0, 5, 10, 15, 20],
+                list(counts['age']) == [3, 0, 1, 0],
+                counts['weight'].sum() == 5,
+                counts['fitness'].size == 20,
+                not sim.carnivore_histogram_counts['age'].any()])
+
+
+def test_population_map_kept_between_graphics_years(map_str):
+    """Test that the heatmap data is a float copy, which later headless years leave unchanged."""
+    ini_pop = [{'loc': (2, 2), 'pop': [{'species': 'Herbivore', 'age': 5, 'weight': 20}
+                                       for _ in range(50)]}]
+    sim = BioSim(map_str, ini_pop, seed=1, vis_years=0)
+    sim._collect_annual_data()
+    collected = sim.population_map_herbivore.copy()
+    sim.simulate(3)
+
+    assert all([sim.population_map_herbivore.dtype == float,
+                (sim.population_map_herbivore == collected).all(),
+                collected[1, 1] == 50,
+                sim.num_animals_per_species['Herbivore'] != 50])